@@ -1,4 +1,5 @@
 import logging
+import warnings
 from pathlib import Path
 from typing import BinaryIO
 
@@ -236,6 +237,7 @@ class DFoundationsModel(BaseModel):
         internal_profile = profile._to_internal(cpt_id)
 
         profile = self.profiles.add_profile_if_unique(internal_profile)
+        self.profiles.set_excavation_level(profile.excavation_level)
 
         # Automatically select all profiles for calculation
         if isinstance(self.datastructure.input_data.preliminary_design, str):
@@ -272,6 +274,10 @@ class DFoundationsModel(BaseModel):
         i_location = location._to_internal(pile_id)
         if i_location not in locations:
             locations.append(i_location)
+        else:
+            warnings.warn(
+                f"Pile with name: {i_location.pile_name} already exists, pile is not added."
+            )
 
         # Enable Pile in calculation
         if isinstance(self.datastructure.input_data.preliminary_design, str):
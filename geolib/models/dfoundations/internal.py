@@ -1,8 +1,25 @@
 import logging
-from enum import IntEnum
+import sys
+import warnings
+from dataclasses import dataclass, field
+from enum import IntEnum, IntFlag, auto
+from functools import cache
 from inspect import cleandoc
-
-from pydantic import Field, StringConstraints
+from typing import Any, ClassVar, Iterable, Literal, Sequence, get_args
+
+import numpy as np
+from pydantic import (
+    Field,
+    ModelWrapValidatorHandler,
+    PrivateAttr,
+    StringConstraints,
+    TypeAdapter,
+    WithJsonSchema,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from pydantic.types import PositiveInt
 from typing_extensions import Annotated
 
@@ -34,6 +51,76 @@ logger = logging.getLogger(__name__)
 UNKNOWN = "Unknown"
 REQ_RUN_LINES = 6
 
+# Structures built from data that was already validated by the public
+# classes (Profile, CPT, Pile, PileLocation) skip revalidation when this
+# is disabled. Parsed input files are always validated.
+ENABLE_VALIDATION = True
+
+
+class TrustedStructure:
+    """Mixin for internal structures that are mostly constructed
+    from data that has already been validated upstream."""
+
+    @classmethod
+    def unchecked(cls, **kwargs):
+        """Construct the structure without any validation.
+
+        Only use this for trusted, fully typed, data.
+        """
+        return cls.model_construct(_fields_set=set(kwargs), **kwargs)
+
+    @classmethod
+    def from_trusted(cls, **kwargs):
+        """Construct the structure from already validated data.
+
+        Validation is skipped unless `ENABLE_VALIDATION` is set or
+        required fields are missing, so errors are still raised.
+        """
+        if ENABLE_VALIDATION or not cls._required_fields().issubset(kwargs):
+            return cls(**kwargs)
+        return cls.unchecked(**kwargs)
+
+    @classmethod
+    def _required_fields(cls) -> set[str]:
+        return {name for name, field in cls.model_fields.items() if field.is_required()}
+
+
+class NameIndexedCollection:
+    """Mixin for collections that are (repeatedly) looked up by name.
+
+    Keeps a name to position index in `_name_to_idx`, which concrete
+    classes declare as private attribute together with `_indexed`. The
+    index is rebuilt when the list was replaced or changed in length, or
+    when a hit turns out to be stale. Otherwise a miss is trusted, so the
+    uniqueness checks of the add methods stay O(1). Lookups that must find
+    items which were replaced or renamed in place pass `rebuild_on_miss`.
+    """
+
+    def _find_index(
+        self, items: list, attribute: str, key: str, rebuild_on_miss: bool = False
+    ) -> int | None:
+        i = self._name_to_idx.get(key)
+        if i is not None:
+            if i < len(items) and getattr(items[i], attribute) == key:
+                return i
+        elif not rebuild_on_miss and self._indexed == (id(items), len(items)):
+            return None
+        return self._rebuild_index(items, attribute).get(key)
+
+    def _rebuild_index(self, items: list, attribute: str) -> dict[str, int]:
+        index: dict[str, int] = {}
+        for j, item in enumerate(items):
+            index.setdefault(getattr(item, attribute), j)
+        self._name_to_idx = index
+        self._indexed = (id(items), len(items))
+        return index
+
+    def _add_to_index(self, items: list, attribute: str) -> None:
+        """Registers the last item of `items`, if the index was up to date."""
+        if self._indexed == (id(items), len(items) - 1):
+            self._name_to_idx.setdefault(getattr(items[-1], attribute), len(items) - 1)
+            self._indexed = (id(items), len(items))
+
 
 class PileType(IntEnum):
     PREFABRICATED_CONCRETE_PILE = 0
@@ -107,38 +194,228 @@ class PileShape(IntEnum):
     USER_DEFINED = 11
 
 
-class TypesBearingPiles(DSeriesNoParseSubStructure):
-    pile_name: str = ""
-    pile_type: PileType = PileType.PREFABRICATED_CONCRETE_PILE
-    pile_type_for_execution_factor_sand_gravel: PileType | None = None
-    execution_factor_sand_gravel: Annotated[float, Field(ge=0, le=9)] | None = None
-    pile_type_for_execution_factor_clay_loam_peat: PileTypeForClayLoamPeat | None = None
-    execution_factor_clay_loam_peat: Annotated[float, Field(ge=0, le=9)] | None = None
-    pile_type_for_pile_class_factor: PileType | None = None
-    pile_class_factor: Annotated[float, Field(ge=0, le=9)] | None = None
-    pile_type_for_load_settlement_curve: LoadSettlementCurve | None = None
-    material: PileMaterial | None = None
-    elasticity_modulus: Annotated[float, Field(ge=0, le=1e25)] | None = None
-    slip_layer: BearingPileSlipLayer = BearingPileSlipLayer.NONE
-    characteristic_adhesion: Annotated[float, Field(ge=0, le=1000)] | None = None
-    shape: PileShape = PileShape.RECTANGULAR_PILE
+class RoundPileGeometry(BaseDataClass):
+    shape: Literal[PileShape.ROUND_PILE] = PileShape.ROUND_PILE
+    diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RectangularPileGeometry(BaseDataClass):
+    """Geometry of rectangular piles, also used for (bearing) sections."""
+
+    shape: Literal[PileShape.RECTANGULAR_PILE, PileShape.SECTION] = (
+        PileShape.RECTANGULAR_PILE
+    )
     base_width: Annotated[float, Field(ge=0, le=100)] | None = None
     base_length: Annotated[float, Field(ge=0, le=100)] | None = None
-    diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RoundPileWithEnlargedBaseGeometry(BaseDataClass):
+    """Geometry of round piles with an enlarged or in situ formed base."""
+
+    shape: Literal[
+        PileShape.ROUND_PILE_WITH_ENLARGED_BASE,
+        PileShape.ROUND_PILE_WITH_IN_SITU_FORMED_BASE,
+    ] = PileShape.ROUND_PILE_WITH_ENLARGED_BASE
     base_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
     pile_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
     base_height: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RectangularPileWithEnlargedBaseGeometry(BaseDataClass):
+    shape: Literal[PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE] = (
+        PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE
+    )
     base_width_v: Annotated[float, Field(ge=0, le=100)] | None = None
     base_length_v: Annotated[float, Field(ge=0, le=100)] | None = None
+    base_height: Annotated[float, Field(ge=0, le=100)] | None = None
     shaft_width: Annotated[float, Field(ge=0, le=100)] | None = None
     shaft_length: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RoundTaperedPileGeometry(BaseDataClass):
+    shape: Literal[PileShape.ROUND_TAPERED_PILE] = PileShape.ROUND_TAPERED_PILE
+    diameter: Annotated[float, Field(ge=0, le=100)] | None = None
     increase_in_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RoundHollowPileGeometry(BaseDataClass):
+    """Geometry of round hollow piles, with a closed base or open ended."""
+
+    shape: Literal[
+        PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE,
+        PileShape.ROUND_OPEN_ENDED_HOLLOW_PILE,
+    ] = PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE
     external_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
     internal_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class RoundPileWithLostTipGeometry(BaseDataClass):
+    shape: Literal[PileShape.ROUND_PILE_WITH_LOST_TIP] = (
+        PileShape.ROUND_PILE_WITH_LOST_TIP
+    )
+    base_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+    pile_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class HShapedPileGeometry(BaseDataClass):
+    shape: Literal[PileShape.H_SHAPED_PROFILE] = PileShape.H_SHAPED_PROFILE
     height_h_shape: Annotated[float, Field(ge=0, le=100)] | None = None
     width_h_shape: Annotated[float, Field(ge=0, le=100)] | None = None
     thickness_web: Annotated[float, Field(ge=0, le=100)] | None = None
     thickness_flange: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+class UserDefinedPileGeometry(BaseDataClass):
+    shape: Literal[PileShape.USER_DEFINED] = PileShape.USER_DEFINED
+    circumference: Annotated[float, Field(ge=0, le=100)] | None = None
+    cross_section: Annotated[float, Field(ge=0, le=100)] | None = None
+
+
+PileGeometry = Annotated[
+    RoundPileGeometry
+    | RectangularPileGeometry
+    | RoundPileWithEnlargedBaseGeometry
+    | RectangularPileWithEnlargedBaseGeometry
+    | RoundTaperedPileGeometry
+    | RoundHollowPileGeometry
+    | RoundPileWithLostTipGeometry
+    | HShapedPileGeometry
+    | UserDefinedPileGeometry,
+    Field(discriminator="shape"),
+]
+
+# Geometry class per shape, from the shape literals of the geometries.
+_GEOMETRY_BY_SHAPE = {
+    shape: geometry
+    for geometry in get_args(get_args(PileGeometry)[0])
+    for shape in get_args(geometry.model_fields["shape"].annotation)
+}
+
+# All dimensions that used to be (flat) fields of the pile types.
+_GEOMETRY_FIELDS = frozenset(
+    name
+    for geometry in _GEOMETRY_BY_SHAPE.values()
+    for name in geometry.model_fields
+    if name != "shape"
+)
+
+
+class PileGeometryAccess:
+    """Mixin for pile types, which store their dimensions in `geometry`.
+
+    Supports the flat (legacy) layout, with all dimensions as attributes
+    of the pile type. Dimensions that are not part of the geometry of
+    the current shape are kept in `_pending_dimensions`, which concrete
+    classes declare as private attribute, until `shape` is set to a
+    shape they apply to. Setting `shape` rebuilds the geometry from all
+    known dimensions, so dimensions and shape can be set in any order.
+    """
+
+    def __getattr__(self, name: str):
+        if name in _GEOMETRY_FIELDS:
+            if name in type(self.geometry).model_fields:
+                return getattr(self.geometry, name)
+            return self._pending_dimensions.get(name)
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _GEOMETRY_FIELDS:
+            if name in type(self.geometry).model_fields:
+                setattr(self.geometry, name, value)
+            else:
+                self._pending_dimensions = {**self._pending_dimensions, name: value}
+            return
+        super().__setattr__(name, value)
+
+    @property
+    def shape(self) -> PileShape:
+        return self.geometry.shape
+
+    @shape.setter
+    def shape(self, value: PileShape) -> None:
+        dimensions = {**self._pending_dimensions, **dict(self.geometry)}
+        self.geometry = self._geometry_data(value, dimensions)
+        self._pending_dimensions = self._pending_data(value, dimensions)
+
+    @classmethod
+    def unchecked(cls, **kwargs):
+        """Same as `TrustedStructure.unchecked`, also for the flat layout."""
+        kwargs, pending = cls._fold_geometry(kwargs)
+        if isinstance(kwargs.get("geometry"), dict):
+            data = kwargs["geometry"]
+            kwargs["geometry"] = _GEOMETRY_BY_SHAPE[data["shape"]].model_construct(**data)
+        pile_type = super().unchecked(**kwargs)
+        pile_type._pending_dimensions = pending
+        return pile_type
+
+    @staticmethod
+    def _geometry_data(shape: Any, dimensions: dict) -> dict:
+        """Geometry of `shape`, with the (not None) `dimensions` that apply to it."""
+        geometry = _GEOMETRY_BY_SHAPE.get(shape)
+        fields = _GEOMETRY_FIELDS if geometry is None else geometry.model_fields
+        data = {"shape": shape}
+        for name, value in dimensions.items():
+            if name != "shape" and name in fields and value is not None:
+                data[name] = value
+        return data
+
+    @staticmethod
+    def _pending_data(shape: Any, dimensions: dict) -> dict:
+        """The (not None) `dimensions` that do not apply to `shape`."""
+        geometry = _GEOMETRY_BY_SHAPE.get(shape)
+        if geometry is None:
+            return {}
+        return {
+            name: value
+            for name, value in dimensions.items()
+            if name not in geometry.model_fields and value is not None
+        }
+
+    @classmethod
+    def _validate_flat_geometry(cls, data: Any, handler: ModelWrapValidatorHandler):
+        """Validates `data` with `handler`, folding flat fields first."""
+        data, pending = cls._fold_geometry(data)
+        pile_type = handler(data)
+        if pending:
+            pile_type._pending_dimensions = pending
+        return pile_type
+
+    @classmethod
+    def _fold_geometry(cls, data: Any) -> tuple[Any, dict]:
+        """Moves flat `shape` and dimension fields into `geometry`.
+
+        Returns:
+            tuple[Any, dict]: The folded data and the dimensions that
+            do not apply to its shape.
+        """
+        if not isinstance(data, dict) or "geometry" in data:
+            return data, {}
+        if "shape" not in data and _GEOMETRY_FIELDS.isdisjoint(data):
+            return data, {}
+        data = dict(data)
+        shape = data.pop("shape", PileShape.RECTANGULAR_PILE)
+        dimensions = {
+            name: data.pop(name) for name in _GEOMETRY_FIELDS.intersection(data)
+        }
+        data["geometry"] = cls._geometry_data(shape, dimensions)
+        return data, cls._pending_data(shape, dimensions)
+
+
+class TypesBearingPiles(PileGeometryAccess, TrustedStructure, DSeriesNoParseSubStructure):
+    pile_name: str = ""
+    pile_type: PileType = PileType.PREFABRICATED_CONCRETE_PILE
+    pile_type_for_execution_factor_sand_gravel: PileType | None = None
+    execution_factor_sand_gravel: Annotated[float, Field(ge=0, le=9)] | None = None
+    pile_type_for_execution_factor_clay_loam_peat: PileTypeForClayLoamPeat | None = None
+    execution_factor_clay_loam_peat: Annotated[float, Field(ge=0, le=9)] | None = None
+    pile_type_for_pile_class_factor: PileType | None = None
+    pile_class_factor: Annotated[float, Field(ge=0, le=9)] | None = None
+    pile_type_for_load_settlement_curve: LoadSettlementCurve | None = None
+    material: PileMaterial | None = None
+    elasticity_modulus: Annotated[float, Field(ge=0, le=1e25)] | None = None
+    slip_layer: BearingPileSlipLayer = BearingPileSlipLayer.NONE
+    characteristic_adhesion: Annotated[float, Field(ge=0, le=1000)] | None = None
+    geometry: PileGeometry = RectangularPileGeometry()
     overrule_pile_tip_shape_factor: Bool = Bool.FALSE
     pile_tip_shape_factor: Annotated[float, Field(ge=0, le=10)] | None = None
     overrule_pile_tip_cross_section_factors: Bool = Bool.FALSE
@@ -149,8 +426,20 @@ class TypesBearingPiles(DSeriesNoParseSubStructure):
     reduction_percentage_qc: Annotated[float, Field(ge=25, le=100)] = 25
     is_user_defined: Bool = Bool.TRUE
 
+    _pending_dimensions = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def accept_flat_geometry(cls, data: Any, handler: ModelWrapValidatorHandler):
+        return cls._validate_flat_geometry(data, handler)
+
+    @field_validator("pile_name", mode="after")
+    @classmethod
+    def intern_pile_name(cls, value: str) -> str:
+        return sys.intern(value)
+
 
-class TypesTensionPiles(DSeriesNoParseSubStructure):
+class TypesTensionPiles(PileGeometryAccess, TrustedStructure, DSeriesNoParseSubStructure):
     pile_name: str = ""
     pile_type: PileType = PileType.PREFABRICATED_CONCRETE_PILE
     pile_type_for_execution_factor_sand_gravel: PileType | None = None
@@ -160,56 +449,53 @@ class TypesTensionPiles(DSeriesNoParseSubStructure):
     material: PileMaterial | None = None
     unit_weight_pile: Annotated[float, Field(ge=0, le=1000)] | None = None
     elasticity_modulus: Annotated[float, Field(ge=0, le=1e25)] | None = None
-    shape: PileShape = PileShape.RECTANGULAR_PILE
-    base_width: Annotated[float, Field(ge=0, le=100)] | None = None
-    base_length: Annotated[float, Field(ge=0, le=100)] | None = None
-    diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    base_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    pile_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    base_height: Annotated[float, Field(ge=0, le=100)] | None = None
-    base_width_v: Annotated[float, Field(ge=0, le=100)] | None = None
-    base_length_v: Annotated[float, Field(ge=0, le=100)] | None = None
-    shaft_width: Annotated[float, Field(ge=0, le=100)] | None = None
-    shaft_length: Annotated[float, Field(ge=0, le=100)] | None = None
-    increase_in_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    external_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    internal_diameter: Annotated[float, Field(ge=0, le=100)] | None = None
-    height_h_shape: Annotated[float, Field(ge=0, le=100)] | None = None
-    width_h_shape: Annotated[float, Field(ge=0, le=100)] | None = None
-    thickness_web: Annotated[float, Field(ge=0, le=100)] | None = None
-    thickness_flange: Annotated[float, Field(ge=0, le=100)] | None = None
-    circumference: Annotated[float, Field(ge=0, le=100)] | None = None
-    cross_section: Annotated[float, Field(ge=0, le=100)] | None = None
+    geometry: PileGeometry = RectangularPileGeometry()
     is_user_defined: Bool = Bool.TRUE
 
+    _pending_dimensions = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def accept_flat_geometry(cls, data: Any, handler: ModelWrapValidatorHandler):
+        return cls._validate_flat_geometry(data, handler)
+
+    @field_validator("pile_name", mode="after")
+    @classmethod
+    def intern_pile_name(cls, value: str) -> str:
+        return sys.intern(value)
+
 
-class SoilCollection(DSeriesStructureCollection):
+class SoilCollection(NameIndexedCollection, DSeriesStructureCollection):
     soil: list[Soil] = Soil.default_soils()
 
+    # Not annotated, so the parser does not pick these up as structure fields.
+    _name_to_idx = PrivateAttr(default_factory=dict)
+    _indexed = PrivateAttr(default=(0, 0))
+
     def add_soil_if_unique(self, soil) -> None:
-        for added_soil in self.soil:
-            if soil.name == added_soil.name:
-                raise NameError(f"Soil with name {soil.name} already exists.")
+        if self._find_index(self.soil, "name", soil.name) is not None:
+            raise NameError(f"Soil with name {soil.name} already exists.")
         self.soil.append(soil)
+        self._add_to_index(self.soil, "name")
         return soil
 
     def find_soil_id(self, key) -> int:
-        for i, soil in enumerate(self.soil):
-            if soil.name == key:
-                return i
-        raise KeyError(f"Soil with {key} not present.")
+        i = self._find_index(self.soil, "name", key, rebuild_on_miss=True)
+        if i is None:
+            raise KeyError(f"Soil with {key} not present.")
+        return i
 
     def __getitem__(self, key) -> Soil:
         if isinstance(key, int):
             return self.soil[key]
         elif isinstance(key, str):
-            for soil in self.soil:
-                if soil.name == key:
-                    return soil
-            raise KeyError(key)
+            i = self._find_index(self.soil, "name", key, rebuild_on_miss=True)
+            if i is None:
+                raise KeyError(key)
+            return self.soil[i]
 
 
-class Layer(DSeriesTreeStructure):
+class Layer(TrustedStructure, DSeriesTreeStructure):
     name: str = ""  # will be generated by template
     material: int
     top_level: float  # [m]
@@ -219,13 +505,25 @@ class Layer(DSeriesTreeStructure):
     reduction_core_resistance: float = 0.0  # [%]
 
 
+LAYER_DTYPE = np.dtype(
+    [
+        ("material", "i4"),
+        ("top_level", "f8"),
+        ("excess_pore_pressure_top", "f8"),
+        ("excess_pore_pressure_bottom", "f8"),
+        ("ocr_value", "f8"),
+        ("reduction_core_resistance", "f8"),
+    ]
+)
+
+
 class ReductionCoreResistanceEnum(IntEnum):
     SAFE = 0
     BEGEMANN = 1
     MANUAL = 2
 
 
-class Profile(DSeriesTreeStructure):
+class Profile(TrustedStructure, DSeriesTreeStructure):
     name: str
     matching_cpt: int
     x_coordinate: float
@@ -251,36 +549,57 @@ class Profile(DSeriesTreeStructure):
 
     layers: list[Layer] = []
 
+    @property
+    def layers_array(self) -> np.ndarray:
+        """Numerical layer data as a structured array of `LAYER_DTYPE`,
+        with a record per layer, for vectorized calculations over
+        (many) layers. Changes to the array are not reflected in `layers`.
+        """
+        names = LAYER_DTYPE.names
+        return np.fromiter(
+            (tuple(getattr(layer, name) for name in names) for layer in self.layers),
+            dtype=LAYER_DTYPE,
+            count=len(self.layers),
+        )
+
 
-class Profiles(DSeriesTreeStructureCollection):
+class Profiles(NameIndexedCollection, DSeriesTreeStructureCollection):
     profiles: list[Profile] = []
 
+    # Not annotated, so the parser does not pick these up as structure fields.
+    _name_to_idx = PrivateAttr(default_factory=dict)
+    _indexed = PrivateAttr(default=(0, 0))
+
     def add_profile_if_unique(self, profile: Profile) -> Profile:
-        for added_profile in self.profiles:
-            added_profile.excavation_level = profile.excavation_level
-            if profile.name == added_profile.name:
-                raise NameError(f"profile with name {profile.name} already exists.")
+        if self._find_index(self.profiles, "name", profile.name) is not None:
+            raise NameError(f"profile with name {profile.name} already exists.")
         self.profiles.append(profile)
+        self._add_to_index(self.profiles, "name")
         return profile
 
+    def set_excavation_level(self, excavation_level: float) -> None:
+        """Sets the excavation level of all profiles, as D-Foundations
+        uses a single excavation level per model. Only profiles with a
+        different level are (re)validated."""
+        for profile in self.profiles:
+            if profile.excavation_level != excavation_level:
+                profile.excavation_level = excavation_level
+
 
 class InternalPile(BaseDataClass):
     # Only share method here, as shared properties
     # will not be picked up by parsers/pydantic
     def __eq__(self, other):
-        """Overrides the default implementation"""
-        if self.pile_name == other.pile_name:
-            Warning(
-                "Pile with name: "
-                + self.pile_name
-                + " already exists, pile is not added."
-            )
-            return True
-        else:
-            return False
+        """Overrides the default implementation, piles are equal by name."""
+        if not isinstance(other, InternalPile):
+            return NotImplemented
+        return self.pile_name == other.pile_name
 
+    def __hash__(self):
+        return hash(self.pile_name)
 
-class PositionBearingPile(InternalPile):
+
+class PositionBearingPile(TrustedStructure, InternalPile):
     index: PositiveInt = 1
     x_coordinate: Annotated[float, Field(ge=-10000000, le=100000000)]
     y_coordinate: Annotated[float, Field(ge=-10000000, le=100000000)]
@@ -291,7 +610,7 @@ class PositionBearingPile(InternalPile):
     pile_name: Annotated[str, StringConstraints(min_length=1, max_length=100)]
 
 
-class PositionTensionPile(InternalPile):
+class PositionTensionPile(TrustedStructure, InternalPile):
     index: PositiveInt = 1
     x_coordinate: Annotated[float, Field(ge=-10000000, le=100000000)]
     y_coordinate: Annotated[float, Field(ge=-10000000, le=100000000)]
@@ -304,16 +623,153 @@ class PositionTensionPile(InternalPile):
     pile_name: Annotated[str, StringConstraints(min_length=1, max_length=100)]
 
 
-class PositionsBearingPiles(DSeriesNoParseSubStructure):
-    positions: list[PositionBearingPile] = []
+@cache
+def _type_adapter(tp: type) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+class PositionsContainer:
+    """Mixin for the (slotted) dataclass containers of pile positions,
+    which are not validated again once constructed."""
+
+    __slots__ = ()
+
+    @classmethod
+    def model_validate(cls, obj: Any):
+        return _type_adapter(cls).validate_python(obj)
+
+    def bulk_add(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Validates and adds many positions (e.g. rows of a csv file)
+        in a single validation call. Like `add_pile_if_unique`, positions
+        with an existing pile name are not added."""
+        adapter = _type_adapter(list[self._position_type])
+        self._extend_unique(adapter.validate_python(list(rows)))
+
+    def bulk_add_columns(self, **columns: Sequence) -> None:
+        """Adds positions from equally sized columns of already validated,
+        fully typed, data (e.g. arrays of a dataframe), one value per field.
+
+        Validation is skipped unless `ENABLE_VALIDATION` is set. Positions
+        with an existing pile name are not added.
+        """
+        names = tuple(columns)
+        # Build all positions first, so nothing is added when a column is
+        # too short or a position is invalid.
+        positions = [
+            self._position_type.from_trusted(**dict(zip(names, values)))
+            for values in zip(*columns.values(), strict=True)
+        ]
+        self._extend_unique(positions)
+
+    def _extend_unique(self, positions: list[InternalPile]) -> None:
+        """Adds the `positions` of which the pile name is not yet used,
+        warns for the others."""
+        names = {position.pile_name for position in self.positions}
+        for position in positions:
+            if position.pile_name in names:
+                warnings.warn(
+                    f"Pile with name: {position.pile_name} already exists, "
+                    "pile is not added."
+                )
+                continue
+            names.add(position.pile_name)
+            self.positions.append(position)
+
+
+@dataclass(frozen=True, slots=True)
+class PositionsBearingPiles(PositionsContainer):
+    positions: list[PositionBearingPile] = field(default_factory=list)
+
+    _position_type: ClassVar[type[PositionBearingPile]] = PositionBearingPile
+
+
+@dataclass(frozen=True, slots=True)
+class PositionsTensionPiles(PositionsContainer):
+    positions: list[PositionTensionPile] = field(default_factory=list)
+
+    _position_type: ClassVar[type[PositionTensionPile]] = PositionTensionPile
+
+
+# Column of measured CPT data, which is (de)serialized as list of floats.
+FloatArray = Annotated[
+    np.ndarray, WithJsonSchema({"type": "array", "items": {"type": "number"}})
+]
+
+
+class CPTMeasureData(TrustedStructure, DFoundationsTableWrapper):
+    """Measured CPT table, stored per column (e.g. z, qc, rw, ws, GEFFrict)
+    as float arrays, in the column order of the file.
+
+    The legacy row wise format, a list of dicts, is still accepted
+    as `data` (or `columns`) and can be reconstructed with `rows`,
+    or with the deprecated (read-only) `data`.
+    """
 
+    columns: dict[str, FloatArray] = {}
 
-class PositionsTensionPiles(DSeriesNoParseSubStructure):
-    positions: list[PositionTensionPile] = []
+    @model_validator(mode="before")
+    @classmethod
+    def accept_legacy_data(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "data" in data:
+            data = dict(data)
+            data["columns"] = data.pop("data")
+        return data
 
+    @field_validator("columns", mode="before")
+    @classmethod
+    def to_columns(cls, value: Any) -> dict[str, np.ndarray]:
+        """Converts a list of row dicts or a dict of column sequences
+        to a dict of contiguous float arrays."""
+        if isinstance(value, list):
+            if len(value) == 0:
+                return {}
+            try:
+                return {
+                    key: np.fromiter((row[key] for row in value), float, len(value))
+                    for key in value[0]
+                }
+            except KeyError as e:
+                raise ValueError(f"Not all rows of the measured data have {e}.") from e
+        if isinstance(value, dict):
+            columns = {
+                key: np.ascontiguousarray(column, dtype=float)
+                for key, column in value.items()
+            }
+            if len({len(column) for column in columns.values()}) > 1:
+                raise ValueError("All columns of the measured data must be equally long.")
+            return columns
+        return value
+
+    @field_serializer("columns", when_used="json")
+    def serialize_columns(self, columns: dict[str, np.ndarray]) -> dict[str, list]:
+        return {key: column.tolist() for key, column in columns.items()}
+
+    @property
+    def rows(self) -> list[dict[str, float]]:
+        """Measured data in the legacy row wise format."""
+        keys = list(self.columns)
+        return [
+            dict(zip(keys, values))
+            for values in zip(*(column.tolist() for column in self.columns.values()))
+        ]
+
+    @property
+    def data(self) -> list[dict[str, float]]:
+        """Deprecated, use `rows` or `columns` instead."""
+        warnings.warn(
+            "CPTMeasureData.data is deprecated, use rows or columns instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.rows
 
-class CPTMeasureData(DFoundationsTableWrapper):
-    data: list[dict[str, float]]
+    def __eq__(self, other):
+        if not isinstance(other, CPTMeasureData):
+            return NotImplemented
+        return self.columns.keys() == other.columns.keys() and all(
+            np.array_equal(column, other.columns[key])
+            for key, column in self.columns.items()
+        )
 
 
 class ExcavationType(IntEnum):
@@ -344,7 +800,7 @@ class InterpretationType(IntEnum):
     UNKNOWN = 4
 
 
-class CPT(DFoundationsEnumStructure):
+class CPT(TrustedStructure, DFoundationsEnumStructure):
     cptname: str
     project_name: str = UNKNOWN
     projectid: str = ""
@@ -400,27 +856,68 @@ class CPT(DFoundationsEnumStructure):
     void_value_equivalent_electronic_qc: float = 987000000.000000
     measured_data: CPTMeasureData
 
+    @field_validator(
+        "project_name",
+        "projectid",
+        "project_number",
+        "project_subnumber",
+        "location_name",
+        "client_name",
+        "companyid",
+        "fileowner",
+        "gef_version",
+        "procedurecode",
+        "xy_coordinate_system",
+        mode="after",
+    )
+    @classmethod
+    def intern_survey_strings(cls, value: str) -> str:
+        """These are mostly the same for all CPTs of a survey,
+        so share a single string object between them."""
+        return sys.intern(value)
+
+    @classmethod
+    def from_json_bytes(cls, buf: bytes | str) -> "CPT":
+        """Validates a JSON serialized CPT directly into the structure,
+        without creating an intermediate dict of the measured data.
+
+        Args:
+            buf (bytes | str): JSON representation of a CPT.
 
-class CPTList(DFoundationsCPTCollectionWrapper):
+        Returns:
+            CPT: Validated structure.
+        """
+        return cls.model_validate_json(buf)
+
+
+class CPTList(NameIndexedCollection, DFoundationsCPTCollectionWrapper):
     cpt_collection: list[CPT] = []
 
+    # Not annotated, so the parser does not pick these up as structure fields.
+    _name_to_idx = PrivateAttr(default_factory=dict)
+    _indexed = PrivateAttr(default=(0, 0))
+
     def add_cpt(self, cpt: CPT):
         """Add CPT and return id.
         Forces timeordertype to be the same everywhere.
         """
         for existing_cpt in self.cpt_collection:
-            existing_cpt.timeorder_type = cpt.timeorder_type
+            if existing_cpt.timeorder_type != cpt.timeorder_type:
+                existing_cpt.timeorder_type = cpt.timeorder_type
         self.cpt_collection.append(cpt)
+        self._add_to_index(self.cpt_collection, "cptname")
         return len(self.cpt_collection) - 1
 
     def __getitem__(self, key) -> CPT:
         if isinstance(key, int):
             return self.cpt_collection[key]
         elif isinstance(key, str):
-            for cpt in self.cpt_collection:
-                if cpt.cptname == key:
-                    return cpt
-            raise KeyError(key)
+            i = self._find_index(
+                self.cpt_collection, "cptname", key, rebuild_on_miss=True
+            )
+            if i is None:
+                raise KeyError(key)
+            return self.cpt_collection[i]
 
 
 class CalculationOptions(DSeriesNoParseSubStructure):
@@ -495,20 +992,25 @@ class CalculationOptions(DSeriesNoParseSubStructure):
     surcharge: Annotated[float, Field(ge=0, le=1e7)] = 0
     use_piezometric_levels: Bool = Bool.TRUE
 
-    def __init__(self, *args, **kwargs):
+    @model_validator(mode="before")
+    @classmethod
+    def set_overruled_toggles(cls, data: Any) -> Any:
         """If defaults are overriden, update
         the related toggle fields as well.
+
+        Toggles that are given explicitly are left as is, which also
+        keeps assignment (validated with all fields) from setting them.
         """
+        if not isinstance(data, dict):
+            return data
         toggles = {}
-        for field, value in kwargs.items():
+        for field, value in data.items():
             if value is None:
                 continue  # Nones will be passed by default settings
-            toggle_field = self.find_toggle(field)
-            fields = self.model_fields
-            if toggle_field in fields:
+            toggle_field = _TOGGLE_MAP.get(field)
+            if toggle_field is not None and toggle_field not in data:
                 toggles[toggle_field] = Bool.TRUE
-        kwargs.update(toggles)
-        super().__init__(*args, **kwargs)
+        return {**data, **toggles} if toggles else data
 
     @staticmethod
     def find_toggle(field):
@@ -518,6 +1020,14 @@ class CalculationOptions(DSeriesNoParseSubStructure):
         return "is_" + field.replace("factor_", "") + "_overruled"
 
 
+# Fields of CalculationOptions that have a related toggle field.
+_TOGGLE_MAP: dict[str, str] = {
+    field: CalculationOptions.find_toggle(field)
+    for field in CalculationOptions.model_fields
+    if CalculationOptions.find_toggle(field) in CalculationOptions.model_fields
+}
+
+
 class ModelTypeEnum(IntEnum):
     BEARING_PILES = 0
     TENSION_PILES = 1
@@ -527,11 +1037,12 @@ class ModelTypeEnum(IntEnum):
 class ModelType(DFoundationsInlineProperties):
     model: ModelTypeEnum = ModelTypeEnum.BEARING_PILES
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    @model_validator(mode="after")
+    def warn_unsupported_model(self):
         # We only support Bearing & Tension Piles (NL)
         if self.model >= 2:
             logger.error(f"Model Type {self.model} is unsupported!")
+        return self
 
 
 class MainCalculationType(IntEnum):
@@ -554,13 +1065,16 @@ class CalculationType(DFoundationsInlineProperties):
         SubCalculationType.INDICATION_BEARING_CAPACITY
     )
 
-    def __init__(self, *args, **kwargs):
-        # Set maintype automatically based on subtype
-        super().__init__(*args, **kwargs)
+    @model_validator(mode="after")
+    def set_main_calculationtype(self):
+        # Set maintype automatically based on subtype. Written to __dict__
+        # directly, as assignment would run this validator again.
         if self.sub_calculationtype.value >= 2:
-            self.main_calculationtype = MainCalculationType.PRELIMINARY_DESIGN
+            main_calculationtype = MainCalculationType.PRELIMINARY_DESIGN
         else:
-            self.main_calculationtype = MainCalculationType.VERIFICATION_DESIGN
+            main_calculationtype = MainCalculationType.VERIFICATION_DESIGN
+        self.__dict__["main_calculationtype"] = main_calculationtype
+        return self
 
 
 class PreliminaryDesign(DSeriesNoParseSubStructure):
@@ -588,6 +1102,64 @@ class VersionExternal(DSeriesInlineMappedProperties):
     dgsfoundationcalc____dll: str = "23.1.0.40358"
 
 
+_DEFAULT_USER_CLASSIFICATION_METHOD = cleandoc(
+    """          
+    [USER CLASSIFICATION METHOD]
+    0
+    [END OF USER CLASSIFICATION METHOD]
+    """
+)
+
+_DEFAULT_SLOPES = cleandoc(
+    """
+        0 = number of items
+    """
+)
+
+_DEFAULT_TYPES_BEARING_PILES = cleandoc(
+    """
+    -1 : pile type shown in main graph
+        0 = number of items
+    """
+)
+
+_DEFAULT_TYPES_TENSION_PILES_CUR = cleandoc(
+    """
+    -1 : pile type shown in main graph
+        0 = number of items
+    """
+)
+
+_DEFAULT_TYPES_SHALLOW_FOUNDATIONS = cleandoc(
+    """
+        0 = number of items
+    """
+)
+
+_DEFAULT_LOADS = cleandoc(
+    """
+        0 = number of items
+    """
+)
+
+_DEFAULT_POSITIONS_SHALLOW_FOUNDATIONS = cleandoc(
+    """
+    [TABLE]
+    DataCount=0
+    [END OF TABLE]
+    """
+)
+
+_DEFAULT_LOCATION_MAP = cleandoc(
+    """
+     0.0000
+            0.0000
+            0.0000
+            0.0000
+    """
+)
+
+
 class DFoundationsInputStructure(DSeriesStructure):
     """Representation of complete .foi file."""
 
@@ -598,61 +1170,22 @@ class DFoundationsInputStructure(DSeriesStructure):
     run_identification: str = 6 * "\n"
     cpt_list: CPTList = CPTList()
     profiles: Profiles = Profiles()
-    user_classification_method: str = cleandoc(
-        """          
-        [USER CLASSIFICATION METHOD]
-        0
-        [END OF USER CLASSIFICATION METHOD]
-        """
-    )
-    slopes: str = cleandoc(
-        """
-            0 = number of items
-        """
-    )
-    types___bearing_piles: list[TypesBearingPiles] | str = cleandoc(
-        """
-        -1 : pile type shown in main graph
-            0 = number of items
-        """
-    )
-    types___tension_piles_cur: list[TypesTensionPiles] | str = cleandoc(
-        """
-        -1 : pile type shown in main graph
-            0 = number of items
-        """
-    )
-    types___shallow_foundations: str = cleandoc(
-        """
-            0 = number of items
-        """
-    )
-    loads: str = cleandoc(
-        """
-            0 = number of items
-        """
+    user_classification_method: str = _DEFAULT_USER_CLASSIFICATION_METHOD
+    slopes: str = _DEFAULT_SLOPES
+    types___bearing_piles: list[TypesBearingPiles] | str = _DEFAULT_TYPES_BEARING_PILES
+    types___tension_piles_cur: list[TypesTensionPiles] | str = (
+        _DEFAULT_TYPES_TENSION_PILES_CUR
     )
+    types___shallow_foundations: str = _DEFAULT_TYPES_SHALLOW_FOUNDATIONS
+    loads: str = _DEFAULT_LOADS
     positions___bearing_piles: PositionsBearingPiles | str = PositionsBearingPiles()
 
     positions___tension_piles_cur: PositionsTensionPiles | str = PositionsTensionPiles()
-    positions___shallow_foundations: str = cleandoc(
-        """
-        [TABLE]
-        DataCount=0
-        [END OF TABLE]
-        """
-    )
+    positions___shallow_foundations: str = _DEFAULT_POSITIONS_SHALLOW_FOUNDATIONS
     calculation_options: CalculationOptions | str = CalculationOptions()
     calculationtype: CalculationType = CalculationType()
     preliminary_design: PreliminaryDesign | str = PreliminaryDesign()
-    location_map: str = cleandoc(
-        """
-         0.0000
-                0.0000
-                0.0000
-                0.0000
-        """
-    )
+    location_map: str = _DEFAULT_LOCATION_MAP
 
     # Custom validator
     _validate_run_identification = make_newline_validator(
@@ -750,6 +1283,24 @@ class DFoundationsVerificationResults(DSeriesStructure):
 # region Output
 
 
+class WarningFlag(IntFlag):
+    """Bit per boolean warning of `DFoundationsCalculationWarnings`,
+    named after the upper cased field."""
+
+    IS_WARNING_F1_GIVEN = auto()
+    F1_GREATER_THAN_1_FOUND = auto()
+    IS_WARNING_NEN_DEPTH_GIVEN = auto()
+    IS_WARNING_SF_FUND_WIDTH_GIVEN = auto()
+    IS_WARNING_SF_FUND_LENGTH_GIVEN = auto()
+    IS_WARNING_SF_CUD_GIVEN = auto()
+    IS_WARNING_SF_DELTA_PHI_GIVEN = auto()
+    IS_WARNING_SF_SLOPE_NOT_RELEVANT_GIVEN = auto()
+    IS_WARNING_NEN_SF_PLACEMENT_DEPTH_TOO_DEEP = auto()
+    IS_WARNING_NEN_SF_PLACEMENT_DEPTH_TOO_SHALLOW = auto()
+    IS_WARNING_NEN_BP_POSITIVE_SKIN_FRICTION_ZONE_GIVEN = auto()
+    IS_WARNING_SF_FOUNDATION_LEVEL_FOR_PUNCH_TO_DEEP_FOR_SLOPE_GIVEN = auto()
+
+
 class DFoundationsCalculationWarnings(DSeriesTreeStructure):
     is_warning_f1_given: Bool
     f1_greater_than_1_found: Bool
@@ -765,20 +1316,111 @@ class DFoundationsCalculationWarnings(DSeriesTreeStructure):
     is_warning_nen_bp_positive_skin_friction_zone_given: Bool
     is_warning_sf_foundation_level_for_punch_to_deep_for_slope_given: Bool
 
+    @property
+    def warnings_mask(self) -> WarningFlag:
+        """All given boolean warnings combined, so several warnings
+        can be queried at once with `mask & (WarningFlag.A | WarningFlag.B)`.
+
+        Note that `is_warning_nen_spacing_given` is a count, it is not
+        part of the mask.
+        """
+        mask = WarningFlag(0)
+        for flag in WarningFlag:
+            if getattr(self, flag.name.lower()):
+                mask |= flag
+        return mask
+
+
+# Result sections of the dumpfile that are only parsed on first access.
+_LAZY_SECTIONS = (
+    "verification_results",
+    "verification_results_tp",
+    "calculation_warnings",
+)
+
 
 class DFoundationsDumpfileOutputStructure(DSeriesStructure):
-    results_at_cpt_test_level: str | None = None
-    verification_results: DFoundationsVerificationResults | None = None
+    """Output of the dumpfile.
 
-    calculation_parameters_tension_piles: str | None = None
-    verification_results_tp: DFoundationsVerificationResults | None = None
+    The (large) `verification_results`, `verification_results_tp` and
+    `calculation_warnings` sections are kept as text and only parsed
+    when first accessed, as most callers read just one of them.
+    """
 
+    results_at_cpt_test_level: str | None = None
+    calculation_parameters_tension_piles: str | None = None
     footnote_warnings: str | None = None
     preliminary_design_results: str | None = None
     verification_results_sf: str | None = None
     verification_results_tp_1b2: str | None = None
     verification_design_results: str | None = None
-    calculation_warnings: DFoundationsCalculationWarnings | None = None
+
+    # Not annotated, so the parser does not pick this up as structure field.
+    _sections = PrivateAttr(default_factory=dict)
+
+    def __init__(self, *args, **kwargs):
+        sections = {
+            name: kwargs.pop(name)
+            for name in _LAZY_SECTIONS
+            if kwargs.get(name) is not None
+        }
+        super().__init__(*args, **kwargs)
+        self._sections = sections
+
+    def _get_section(self, name: str, structure: type[DSeriesStructure]):
+        section = self._sections.get(name)
+        if isinstance(section, str):
+            section = self._sections[name] = structure.parse_text(section)
+        elif section is not None and not isinstance(section, structure):
+            # Dumped data, e.g. from model_dump or model_dump_json
+            section = self._sections[name] = structure.model_validate(section)
+        return section
+
+    def _set_section(self, name: str, structure: type[DSeriesStructure], value) -> None:
+        if value is not None and not isinstance(value, structure):
+            value = structure.model_validate(value)
+        self._sections[name] = value
+
+    @computed_field
+    @property
+    def verification_results(self) -> DFoundationsVerificationResults | None:
+        return self._get_section("verification_results", DFoundationsVerificationResults)
+
+    @verification_results.setter
+    def verification_results(self, value: DFoundationsVerificationResults | None):
+        self._set_section("verification_results", DFoundationsVerificationResults, value)
+
+    @computed_field
+    @property
+    def verification_results_tp(self) -> DFoundationsVerificationResults | None:
+        return self._get_section(
+            "verification_results_tp", DFoundationsVerificationResults
+        )
+
+    @verification_results_tp.setter
+    def verification_results_tp(self, value: DFoundationsVerificationResults | None):
+        self._set_section(
+            "verification_results_tp", DFoundationsVerificationResults, value
+        )
+
+    @computed_field
+    @property
+    def calculation_warnings(self) -> DFoundationsCalculationWarnings | None:
+        return self._get_section("calculation_warnings", DFoundationsCalculationWarnings)
+
+    @calculation_warnings.setter
+    def calculation_warnings(self, value: DFoundationsCalculationWarnings | None):
+        self._set_section("calculation_warnings", DFoundationsCalculationWarnings, value)
+
+    def __iter__(self):
+        yield from super().__iter__()
+        for name in _LAZY_SECTIONS:
+            yield name, getattr(self, name)
+
+    def __eq__(self, other):
+        if not isinstance(other, DFoundationsDumpfileOutputStructure):
+            return NotImplemented
+        return dict(self) == dict(other)
 
 
 class DFoundationsStructure(DSeriesStructure):
@@ -10,9 +10,11 @@ from typing_extensions import Annotated
 
 from geolib.geometry import Point
 from geolib.models import BaseDataClass
+from geolib.models.internal import Bool
 
 from .internal import (
     BearingPileSlipLayer,
+    HShapedPileGeometry,
     LoadSettlementCurve,
     PileMaterial,
     PileShape,
@@ -20,8 +22,16 @@ from .internal import (
     PileTypeForClayLoamPeat,
     PositionBearingPile,
     PositionTensionPile,
+    RectangularPileGeometry,
+    RectangularPileWithEnlargedBaseGeometry,
+    RoundHollowPileGeometry,
+    RoundPileGeometry,
+    RoundPileWithEnlargedBaseGeometry,
+    RoundPileWithLostTipGeometry,
+    RoundTaperedPileGeometry,
     TypesBearingPiles,
     TypesTensionPiles,
+    UserDefinedPileGeometry,
 )
 
 
@@ -53,7 +63,7 @@ class BearingPileLocation(PileLocation):
 
     def _to_internal(self, index: PositiveInt):
         pile_location = super()._to_internal(index)
-        return PositionBearingPile(**pile_location, surcharge=self.surcharge)
+        return PositionBearingPile.from_trusted(**pile_location, surcharge=self.surcharge)
 
 
 class TensionPileLocation(PileLocation):
@@ -65,9 +75,9 @@ class TensionPileLocation(PileLocation):
 
     def _to_internal(self, index: PositiveInt):
         pile_location = super()._to_internal(index)
-        return PositionTensionPile(
+        return PositionTensionPile.from_trusted(
             **pile_location,
-            use_alternating_loads=self.use_alternating_loads,
+            use_alternating_loads=Bool(self.use_alternating_loads),
             max_force=self.max_force,
             min_force=self.min_force,
         )
@@ -116,35 +126,39 @@ class BearingPile(Pile):
     pile_tip_cross_section_factor: Annotated[float, Field(ge=0, le=10)] | None = None
 
     def _to_internal(self):
-        return TypesBearingPiles(
+        return TypesBearingPiles.from_trusted(
             pile_name=self.pile_name,
-            pile_type=self.pile_type.value,
+            pile_type=PileType(self.pile_type.value),
             pile_type_for_execution_factor_sand_gravel=PileType.USER_DEFINED,
             execution_factor_sand_gravel=self.pile_class_factor_shaft_sand_gravel,
-            pile_type_for_execution_factor_clay_loam_peat=(
+            pile_type_for_execution_factor_clay_loam_peat=PileTypeForClayLoamPeat(
                 self.preset_pile_class_factor_shaft_clay_loam_peat.value
             ),
             execution_factor_clay_loam_peat=self.pile_class_factor_shaft_clay_loam_peat,
             pile_type_for_pile_class_factor=PileType.USER_DEFINED,
             pile_class_factor=self.pile_class_factor_tip,
             pile_type_for_load_settlement_curve=self.load_settlement_curve,
-            user_defined_pile_type_as_prefab=self.user_defined_pile_type_as_prefab,
-            use_manual_reduction_for_qc=self.use_manual_reduction_for_qc,
+            user_defined_pile_type_as_prefab=Bool(self.user_defined_pile_type_as_prefab),
+            use_manual_reduction_for_qc=Bool(self.use_manual_reduction_for_qc),
             reduction_percentage_qc=self.reduction_percentage_qc,
             material=PileMaterial.USER_DEFINED,
             elasticity_modulus=self.elasticity_modulus,
             slip_layer=BearingPileSlipLayer.USER_DEFINED,
             characteristic_adhesion=self.characteristic_adhesion,
-            overrule_pile_tip_shape_factor=self.overrule_pile_tip_shape_factor,
+            overrule_pile_tip_shape_factor=Bool(self.overrule_pile_tip_shape_factor),
             pile_tip_shape_factor=self.pile_tip_shape_factor,
-            overrule_pile_tip_cross_section_factors=(
+            overrule_pile_tip_cross_section_factors=Bool(
                 self.overrule_pile_tip_cross_section_factors
             ),
             pile_tip_cross_section_factor=self.pile_tip_cross_section_factor,
-            is_user_defined=True,
-            use_pre_2016=False,
+            is_user_defined=Bool.TRUE,
+            use_pre_2016=Bool.FALSE,
+            geometry=self._to_internal_geometry(),
         )
 
+    def _to_internal_geometry(self):
+        return RectangularPileGeometry()
+
 
 class TensionPile(Pile):
     """Inherits :class:`~geolib.models.dfoundations.piles.Pile`."""
@@ -152,30 +166,34 @@ class TensionPile(Pile):
     unit_weight_pile: Annotated[float, Field(ge=0, le=1000)]
 
     def _to_internal(self):
-        return TypesTensionPiles(
+        return TypesTensionPiles.from_trusted(
             pile_name=self.pile_name,
-            pile_type_for_execution_factor_sand_gravel=self.pile_type.value,
+            pile_type_for_execution_factor_sand_gravel=PileType(self.pile_type.value),
             execution_factor_sand_gravel=self.pile_class_factor_shaft_sand_gravel,
-            pile_type_for_execution_factor_clay_loam_peat=(
+            pile_type_for_execution_factor_clay_loam_peat=PileTypeForClayLoamPeat(
                 self.preset_pile_class_factor_shaft_clay_loam_peat.value
             ),
             execution_factor_clay_loam_peat=self.pile_class_factor_shaft_clay_loam_peat,
             material=PileMaterial.USER_DEFINED,
             unit_weight_pile=self.unit_weight_pile,
             elasticity_modulus=self.elasticity_modulus,
+            geometry=self._to_internal_geometry(),
         )
 
+    def _to_internal_geometry(self):
+        return RectangularPileGeometry()
+
 
 class BearingRoundPile(BearingPile):
     """Inherits :class:`~geolib.models.dfoundations.piles.BearingPile`."""
 
     diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.diameter = self.diameter
-        types_bearing_pile.shape = PileShape.ROUND_PILE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RoundPileGeometry(
+            shape=PileShape.ROUND_PILE,
+            diameter=self.diameter,
+        )
 
 
 class TensionRoundPile(TensionPile):
@@ -183,11 +201,11 @@ class TensionRoundPile(TensionPile):
 
     diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.diameter = self.diameter
-        types_tension_pile.shape = PileShape.ROUND_PILE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RoundPileGeometry(
+            shape=PileShape.ROUND_PILE,
+            diameter=self.diameter,
+        )
 
 
 class BearingRectangularPile(BearingPile):
@@ -196,12 +214,12 @@ class BearingRectangularPile(BearingPile):
     base_width: Annotated[float, Field(ge=0, le=100)]
     base_length: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_width = self.base_width
-        types_bearing_pile.base_length = self.base_length
-        types_bearing_pile.shape = PileShape.RECTANGULAR_PILE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RectangularPileGeometry(
+            shape=PileShape.RECTANGULAR_PILE,
+            base_width=self.base_width,
+            base_length=self.base_length,
+        )
 
 
 class TensionRectangularPile(TensionPile):
@@ -210,12 +228,12 @@ class TensionRectangularPile(TensionPile):
     base_width: Annotated[float, Field(ge=0, le=100)]
     base_length: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.base_width = self.base_width
-        types_tension_pile.base_length = self.base_length
-        types_tension_pile.shape = PileShape.RECTANGULAR_PILE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RectangularPileGeometry(
+            shape=PileShape.RECTANGULAR_PILE,
+            base_width=self.base_width,
+            base_length=self.base_length,
+        )
 
 
 class BearingRoundPileWithEnlargedBase(BearingPile):
@@ -225,13 +243,13 @@ class BearingRoundPileWithEnlargedBase(BearingPile):
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
     base_height: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_diameter = self.base_diameter
-        types_bearing_pile.pile_diameter = self.pile_diameter
-        types_bearing_pile.base_height = self.base_height
-        types_bearing_pile.shape = PileShape.ROUND_PILE_WITH_ENLARGED_BASE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithEnlargedBaseGeometry(
+            shape=PileShape.ROUND_PILE_WITH_ENLARGED_BASE,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+            base_height=self.base_height,
+        )
 
 
 class TensionRoundPileWithEnlargedBase(TensionPile):
@@ -241,13 +259,13 @@ class TensionRoundPileWithEnlargedBase(TensionPile):
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
     base_height: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.base_diameter = self.base_diameter
-        types_tension_pile.pile_diameter = self.pile_diameter
-        types_tension_pile.base_height = self.base_height
-        types_tension_pile.shape = PileShape.ROUND_PILE_WITH_ENLARGED_BASE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithEnlargedBaseGeometry(
+            shape=PileShape.ROUND_PILE_WITH_ENLARGED_BASE,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+            base_height=self.base_height,
+        )
 
 
 class BearingRectangularPileWithEnlargedBase(BearingPile):
@@ -259,15 +277,15 @@ class BearingRectangularPileWithEnlargedBase(BearingPile):
     shaft_width: Annotated[float, Field(ge=0, le=100)]
     shaft_length: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_width_v = self.base_width_v
-        types_bearing_pile.base_length_v = self.base_length_v
-        types_bearing_pile.base_height = self.base_height
-        types_bearing_pile.shaft_width = self.shaft_width
-        types_bearing_pile.shaft_length = self.shaft_length
-        types_bearing_pile.shape = PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RectangularPileWithEnlargedBaseGeometry(
+            shape=PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE,
+            base_width_v=self.base_width_v,
+            base_length_v=self.base_length_v,
+            base_height=self.base_height,
+            shaft_width=self.shaft_width,
+            shaft_length=self.shaft_length,
+        )
 
 
 class TensionRectangularPileWithEnlargedBase(TensionPile):
@@ -279,15 +297,15 @@ class TensionRectangularPileWithEnlargedBase(TensionPile):
     shaft_width: Annotated[float, Field(ge=0, le=100)]
     shaft_length: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.base_width_v = self.base_width_v
-        types_tension_pile.base_length_v = self.base_length_v
-        types_tension_pile.base_height = self.base_height
-        types_tension_pile.shaft_width = self.shaft_width
-        types_tension_pile.shaft_length = self.shaft_length
-        types_tension_pile.shape = PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RectangularPileWithEnlargedBaseGeometry(
+            shape=PileShape.RECTANGULAR_PILE_WITH_ENLARGED_BASE,
+            base_width_v=self.base_width_v,
+            base_length_v=self.base_length_v,
+            base_height=self.base_height,
+            shaft_width=self.shaft_width,
+            shaft_length=self.shaft_length,
+        )
 
 
 class BearingRoundTaperedPile(BearingPile):
@@ -296,12 +314,12 @@ class BearingRoundTaperedPile(BearingPile):
     diameter_at_pile_tip: Annotated[float, Field(ge=0, le=100)]
     increase_in_diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.diameter = self.diameter_at_pile_tip
-        types_bearing_pile.increase_in_diameter = self.increase_in_diameter
-        types_bearing_pile.shape = PileShape.ROUND_TAPERED_PILE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RoundTaperedPileGeometry(
+            shape=PileShape.ROUND_TAPERED_PILE,
+            diameter=self.diameter_at_pile_tip,
+            increase_in_diameter=self.increase_in_diameter,
+        )
 
 
 class TensionRoundTaperedPile(TensionPile):
@@ -310,12 +328,12 @@ class TensionRoundTaperedPile(TensionPile):
     diameter_at_pile_tip: Annotated[float, Field(ge=0, le=100)]
     increase_in_diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.diameter = self.diameter_at_pile_tip
-        types_tension_pile.increase_in_diameter = self.increase_in_diameter
-        types_tension_pile.shape = PileShape.ROUND_TAPERED_PILE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RoundTaperedPileGeometry(
+            shape=PileShape.ROUND_TAPERED_PILE,
+            diameter=self.diameter_at_pile_tip,
+            increase_in_diameter=self.increase_in_diameter,
+        )
 
 
 class BearingRoundHollowPileWithClosedBase(BearingPile):
@@ -324,14 +342,12 @@ class BearingRoundHollowPileWithClosedBase(BearingPile):
     external_diameter: Annotated[float, Field(ge=0, le=100)]
     wall_thickness: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.external_diameter = self.external_diameter
-        types_bearing_pile.internal_diameter = (
-            self.external_diameter - 2 * self.wall_thickness
+    def _to_internal_geometry(self):
+        return RoundHollowPileGeometry(
+            shape=PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE,
+            external_diameter=self.external_diameter,
+            internal_diameter=self.external_diameter - 2 * self.wall_thickness,
         )
-        types_bearing_pile.shape = PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE
-        return types_bearing_pile
 
 
 class TensionRoundHollowPileWithClosedBase(TensionPile):
@@ -340,14 +356,12 @@ class TensionRoundHollowPileWithClosedBase(TensionPile):
     external_diameter: Annotated[float, Field(ge=0, le=100)]
     wall_thickness: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.external_diameter = self.external_diameter
-        types_tension_pile.internal_diameter = (
-            self.external_diameter - 2 * self.wall_thickness
+    def _to_internal_geometry(self):
+        return RoundHollowPileGeometry(
+            shape=PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE,
+            external_diameter=self.external_diameter,
+            internal_diameter=self.external_diameter - 2 * self.wall_thickness,
         )
-        types_tension_pile.shape = PileShape.ROUND_HOLLOW_PILE_WITH_CLOSED_BASE
-        return types_tension_pile
 
 
 class BearingRoundPileWithLostTip(BearingPile):
@@ -356,12 +370,12 @@ class BearingRoundPileWithLostTip(BearingPile):
     base_diameter: Annotated[float, Field(ge=0, le=100)]
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_diameter = self.base_diameter
-        types_bearing_pile.pile_diameter = self.pile_diameter
-        types_bearing_pile.shape = PileShape.ROUND_PILE_WITH_LOST_TIP
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithLostTipGeometry(
+            shape=PileShape.ROUND_PILE_WITH_LOST_TIP,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+        )
 
 
 class TensionRoundPileWithLostTip(TensionPile):
@@ -370,12 +384,12 @@ class TensionRoundPileWithLostTip(TensionPile):
     base_diameter: Annotated[float, Field(ge=0, le=100)]
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.base_diameter = self.base_diameter
-        types_tension_pile.pile_diameter = self.pile_diameter
-        types_tension_pile.shape = PileShape.ROUND_PILE_WITH_LOST_TIP
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithLostTipGeometry(
+            shape=PileShape.ROUND_PILE_WITH_LOST_TIP,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+        )
 
 
 class BearingRoundPileWithInSituFormedBase(BearingPile):
@@ -385,13 +399,13 @@ class BearingRoundPileWithInSituFormedBase(BearingPile):
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
     base_height: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_diameter = self.base_diameter
-        types_bearing_pile.pile_diameter = self.pile_diameter
-        types_bearing_pile.base_height = self.base_height
-        types_bearing_pile.shape = PileShape.ROUND_PILE_WITH_IN_SITU_FORMED_BASE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithEnlargedBaseGeometry(
+            shape=PileShape.ROUND_PILE_WITH_IN_SITU_FORMED_BASE,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+            base_height=self.base_height,
+        )
 
 
 class TensionRoundPileWithInSituFormedBase(TensionPile):
@@ -401,13 +415,13 @@ class TensionRoundPileWithInSituFormedBase(TensionPile):
     pile_diameter: Annotated[float, Field(ge=0, le=100)]
     base_height: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.base_diameter = self.base_diameter
-        types_tension_pile.pile_diameter = self.pile_diameter
-        types_tension_pile.base_height = self.base_height
-        types_tension_pile.shape = PileShape.ROUND_PILE_WITH_IN_SITU_FORMED_BASE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return RoundPileWithEnlargedBaseGeometry(
+            shape=PileShape.ROUND_PILE_WITH_IN_SITU_FORMED_BASE,
+            base_diameter=self.base_diameter,
+            pile_diameter=self.pile_diameter,
+            base_height=self.base_height,
+        )
 
 
 class BearingSection(BearingPile):
@@ -416,12 +430,12 @@ class BearingSection(BearingPile):
     base_width: Annotated[float, Field(ge=0, le=100)]
     base_length: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.base_width = self.base_width
-        types_bearing_pile.base_length = self.base_length
-        types_bearing_pile.shape = PileShape.SECTION
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return RectangularPileGeometry(
+            shape=PileShape.SECTION,
+            base_width=self.base_width,
+            base_length=self.base_length,
+        )
 
 
 class TensionSection(TensionPile):
@@ -430,12 +444,12 @@ class TensionSection(TensionPile):
     circumference: Annotated[float, Field(ge=0, le=100)]
     cross_section: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.circumference = self.circumference
-        types_tension_pile.cross_section = self.cross_section
-        types_tension_pile.shape = PileShape.USER_DEFINED
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return UserDefinedPileGeometry(
+            shape=PileShape.USER_DEFINED,
+            circumference=self.circumference,
+            cross_section=self.cross_section,
+        )
 
 
 class BearingRoundOpenEndedHollowPile(BearingPile):
@@ -444,14 +458,12 @@ class BearingRoundOpenEndedHollowPile(BearingPile):
     external_diameter: Annotated[float, Field(ge=0, le=100)]
     wall_thickness: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.external_diameter = self.external_diameter
-        types_bearing_pile.internal_diameter = (
-            self.external_diameter - 2 * self.wall_thickness
+    def _to_internal_geometry(self):
+        return RoundHollowPileGeometry(
+            shape=PileShape.ROUND_OPEN_ENDED_HOLLOW_PILE,
+            external_diameter=self.external_diameter,
+            internal_diameter=self.external_diameter - 2 * self.wall_thickness,
         )
-        types_bearing_pile.shape = PileShape.ROUND_OPEN_ENDED_HOLLOW_PILE
-        return types_bearing_pile
 
 
 class TensionRoundOpenEndedHollowPile(TensionPile):
@@ -460,14 +472,12 @@ class TensionRoundOpenEndedHollowPile(TensionPile):
     external_diameter: Annotated[float, Field(ge=0, le=100)]
     wall_thickness: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.external_diameter = self.external_diameter
-        types_tension_pile.internal_diameter = (
-            self.external_diameter - 2 * self.wall_thickness
+    def _to_internal_geometry(self):
+        return RoundHollowPileGeometry(
+            shape=PileShape.ROUND_OPEN_ENDED_HOLLOW_PILE,
+            external_diameter=self.external_diameter,
+            internal_diameter=self.external_diameter - 2 * self.wall_thickness,
         )
-        types_tension_pile.shape = PileShape.ROUND_OPEN_ENDED_HOLLOW_PILE
-        return types_tension_pile
 
 
 class BearingHShapedPile(BearingPile):
@@ -478,14 +488,14 @@ class BearingHShapedPile(BearingPile):
     thickness_web: Annotated[float, Field(ge=0, le=100)]
     thickness_flange: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_bearing_pile = super()._to_internal()
-        types_bearing_pile.height_h_shape = self.height_h_shape
-        types_bearing_pile.width_h_shape = self.width_h_shape
-        types_bearing_pile.thickness_web = self.thickness_web
-        types_bearing_pile.thickness_flange = self.thickness_flange
-        types_bearing_pile.shape = PileShape.H_SHAPED_PROFILE
-        return types_bearing_pile
+    def _to_internal_geometry(self):
+        return HShapedPileGeometry(
+            shape=PileShape.H_SHAPED_PROFILE,
+            height_h_shape=self.height_h_shape,
+            width_h_shape=self.width_h_shape,
+            thickness_web=self.thickness_web,
+            thickness_flange=self.thickness_flange,
+        )
 
 
 class TensionHShapedPile(TensionPile):
@@ -496,11 +506,11 @@ class TensionHShapedPile(TensionPile):
     thickness_web: Annotated[float, Field(ge=0, le=100)]
     thickness_flange: Annotated[float, Field(ge=0, le=100)]
 
-    def _to_internal(self):
-        types_tension_pile = super()._to_internal()
-        types_tension_pile.height_h_shape = self.height_h_shape
-        types_tension_pile.width_h_shape = self.width_h_shape
-        types_tension_pile.thickness_web = self.thickness_web
-        types_tension_pile.thickness_flange = self.thickness_flange
-        types_tension_pile.shape = PileShape.H_SHAPED_PROFILE
-        return types_tension_pile
+    def _to_internal_geometry(self):
+        return HShapedPileGeometry(
+            shape=PileShape.H_SHAPED_PROFILE,
+            height_h_shape=self.height_h_shape,
+            width_h_shape=self.width_h_shape,
+            thickness_web=self.thickness_web,
+            thickness_flange=self.thickness_flange,
+        )
@@ -5,7 +5,7 @@ from geolib.models import BaseDataClass
 from geolib.models.internal import Bool
 
 from .internal import CPT as InternalCPT
-from .internal import ExcavationType, InterpretationType, Layer
+from .internal import CPTMeasureData, ExcavationType, InterpretationType, Layer
 from .internal import Profile as InternalProfile
 from .internal import ReductionCoreResistanceEnum, TimeOrderType
 
@@ -50,8 +50,10 @@ class CPT(BaseDataClass):
 
     def _to_internal(self) -> InternalCPT:
         kwargs = self.model_dump()
-        kwargs["measured_data"] = {"data": kwargs["measured_data"]}
-        return InternalCPT(**kwargs)
+        kwargs["measured_data"] = CPTMeasureData.from_trusted(
+            columns=CPTMeasureData.to_columns(kwargs["measured_data"])
+        )
+        return InternalCPT.from_trusted(**kwargs)
 
 
 class Excavation(BaseDataClass):
@@ -113,6 +115,7 @@ class Profile(BaseDataClass):
         kwargs["x_coordinate"] = self.location.x
         kwargs["y_coordinate"] = self.location.y
 
+        # Layers are loosely typed dicts, so these are always validated
         kwargs["layers"] = [Layer(**d) for d in self.layers]
 
-        return InternalProfile(**kwargs)
+        return InternalProfile.from_trusted(**kwargs)
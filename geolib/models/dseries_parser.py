@@ -5,6 +5,7 @@ import logging
 import re
 import shlex
 from abc import abstractmethod
+from functools import cache
 from itertools import groupby
 from math import isfinite
 from typing import Iterable, get_type_hints
@@ -25,6 +26,10 @@ from geolib.models.utils import (
 
 logger = logging.getLogger(__name__)
 
+# The fields of a structure are fixed once its class is defined,
+# so the type hints are only resolved on its first instantiation.
+_structure_type_hints: dict[type, dict[str, type]] = {}
+
 
 class DSeriesStructure(BaseModelStructure):
     def __init__(self, *args, **kwargs):
@@ -53,9 +58,13 @@ class DSeriesStructure(BaseModelStructure):
         # Remove fields that are None so defaults will be used
         kwargs = {field: value for field, value in kwargs.items() if value is not None}
 
-        if len(kwargs) > len(get_type_hints(self)):
+        type_hints = _structure_type_hints.get(type(self))
+        if type_hints is None:
+            type_hints = _structure_type_hints[type(self)] = get_type_hints(self)
+
+        if len(kwargs) > len(type_hints):
             a = set(kwargs.keys())
-            b = set(get_type_hints(self).keys())
+            b = set(type_hints.keys())
             raise ValueError(
                 f"""Got more fields than defined on model {self.__class__.__name__}:
                 parser has {a.difference(b)} fields and
@@ -63,7 +72,7 @@ class DSeriesStructure(BaseModelStructure):
                 """
             )
 
-        for field, fieldtype in get_type_hints(self).items():
+        for field, fieldtype in type_hints.items():
             # If the body is a string, we should check
             # whether we can parse it further.
             if field in kwargs and isinstance(kwargs[field], str):
@@ -530,10 +539,22 @@ class DSeriesInlineProperties(DSeriesStructure):
         return expected_property, text
 
     @classmethod
-    def get_properties_in_text(cls, text: str):
-        required_properties_names = [
+    @cache
+    def get_required_properties_names(cls) -> tuple[str, ...]:
+        """Returns the names of the properties in the order they are
+        expected in the text. As this order is fixed by the concrete class
+        definition it is only computed once per class.
+
+        Returns:
+            tuple[str, ...]: Ordered property names.
+        """
+        return tuple(
             structure_name for structure_name, _ in cls.get_structure_required_fields()
-        ]
+        )
+
+    @classmethod
+    def get_properties_in_text(cls, text: str):
+        required_properties_names = cls.get_required_properties_names()
         header_lines = cls.header_lines()
         for idx, (key, value) in enumerate(
             DSerieParser.parse_group(text, loose_properties=True)
@@ -1,9 +1,22 @@
+import logging
+import os
+import struct
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from typing import _GenericAlias
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import BinaryIO, ClassVar, Iterable, Iterator, get_args, get_origin
+from zipfile import (
+    ZIP64_LIMIT,
+    ZIP_DEFLATED,
+    ZIP_FILECOUNT_LIMIT,
+    LargeZipFile,
+    ZipFile,
+    ZipInfo,
+)
 
-from pydantic import DirectoryPath, FilePath
+from pydantic import BaseModel, DirectoryPath, FilePath
 
 from geolib.errors import NotConcreteError
 from geolib.models.serializers import BaseSerializer
@@ -11,35 +24,84 @@ from geolib.models.utils import get_filtered_type_hints
 
 from .internal import DStabilityStructure
 
+try:
+    # Optional libdeflate bindings, which compress considerably faster than zlib
+    import deflate
+except ImportError:
+    deflate = None
+
+logger = logging.getLogger(__name__)
+
+
+def _to_json(data: BaseModel, indent: int | None) -> bytes:
+    """Same as `data.model_dump_json(indent=indent)`, but returns the
+    UTF-8 encoded bytes from pydantic-core without decoding them."""
+    return data.__pydantic_serializer__.to_json(data, indent=indent)
+
+
+@lru_cache
+def _layout_for(structure_type: type) -> tuple[tuple[str, str, str | None], ...]:
+    """Where the fields of a structure are serialized to, resolved once per
+    structure class.
+
+    Returns:
+        tuple[tuple[str, str, str | None], ...]: The field name, structure name
+        and, for list fields which are written to a folder, the structure group.
+    """
+    layout = []
+    for field, fieldtype in get_filtered_type_hints(structure_type):
+        # On List types, write a folder
+        if get_origin(fieldtype) is list:
+            element_type, *_ = get_args(fieldtype)
+            layout.append(
+                (field, element_type.structure_name(), element_type.structure_group())
+            )
+        else:
+            layout.append((field, fieldtype.structure_name(), None))
+    return tuple(layout)
+
 
 class DStabilityBaseSerializer(BaseSerializer, metaclass=ABCMeta):
     """Serializer to folder/file structure."""
 
     ds: DStabilityStructure
 
+    # Indentation of the .json files, None writes compact json
+    indent: ClassVar[int | None] = 4
+
     def serialize(self) -> dict:
-        serialized_datastructure: dict = {}
+        return {
+            name: (
+                {
+                    filename: _to_json(data, self.indent)
+                    for filename, data in content.items()
+                }
+                if isinstance(content, dict)
+                else _to_json(content, self.indent)
+            )
+            for name, content in self._files().items()
+        }
 
-        for field, fieldtype in get_filtered_type_hints(self.ds):
-            # On List types, write a folder
-            if type(fieldtype) == _GenericAlias:  # quite hacky
-                element_type, *_ = fieldtype.__args__  # use getargs in 3.8
+    def _files(self) -> dict:
+        """Layout of the serialized files, as returned by `serialize`,
+        with the structures to be serialized as values."""
+        files: dict = {}
 
-                folder = element_type.structure_group()
-                serialized_datastructure[folder] = {}
+        for field, structure_name, folder in _layout_for(type(self.ds)):
+            data = getattr(self.ds, field)
 
-                for i, data in enumerate(getattr(self.ds, field)):
-                    suffix = f"_{i}" if i > 0 else ""
-                    fn = element_type.structure_name() + suffix + ".json"
-                    serialized_datastructure[folder][fn] = data.model_dump_json(indent=4)
+            # Single structures are a .json in the root folder
+            if folder is None:
+                files[structure_name + ".json"] = data
+                continue
 
-            # Otherwise its a single .json in the root folder
-            else:
-                fn = fieldtype.structure_name() + ".json"
-                data = getattr(self.ds, field)
-                serialized_datastructure[fn] = data.model_dump_json(indent=4)
+            # Lists of structures are written to a folder
+            files[folder] = {
+                f"{structure_name}_{i}.json" if i else f"{structure_name}.json": element
+                for i, element in enumerate(data)
+            }
 
-        return serialized_datastructure
+        return files
 
     @abstractmethod
     def write(self, path):
@@ -56,39 +118,204 @@ class DStabilityInputSerializer(DStabilityBaseSerializer):
                 folder.mkdir(parents=True, exist_ok=True)
 
                 for ffilename, fdata in data.items():
-                    fn = folder / ffilename
-                    with fn.open("wb") as io:
-                        io.write(fdata.encode("utf-8"))
+                    (folder / ffilename).write_bytes(fdata)
             else:
-                fn = filepath / filename
-                with fn.open("wb") as io:
-                    io.write(data.encode("utf-8"))
+                (filepath / filename).write_bytes(data)
 
         return filepath
 
 
 class DStabilityInputZipSerializer(DStabilityBaseSerializer):
-    """DStabilSerializer for zipped.stix files."""
+    """DStabilSerializer for zipped.stix files.
+
+    When the optional `deflate` (libdeflate) package is installed the
+    archive is compressed and written by this class itself, otherwise
+    the standard library ZipFile is used.
+
+    The archive is compressed with `compresslevel`, set it to e.g. 6 or 9
+    on the class for smaller files at the cost of slower writing.
+    """
+
+    # Fastest deflate level, stored .json files compress well anyway
+    compresslevel: ClassVar[int] = 1
+    # Nobody reads the files inside the archive, compact json is
+    # faster to serialize and leaves less to compress.
+    indent: ClassVar[int | None] = None
 
     def write(self, filepath: FilePath | BytesIO) -> FilePath | BytesIO:
+        if deflate is not None and _is_seekable(filepath):
+            try:
+                return self._write_with_libdeflate(filepath)
+            except LargeZipFile:
+                logger.debug("Archive needs zip64, falling back to ZipFile.")
+
         with ZipFile(filepath, mode="w", compression=ZIP_DEFLATED) as zip:
-            serialized_datastructure = self.serialize()
-
-            for filename, data in serialized_datastructure.items():
-                if isinstance(data, dict):
-                    folder = filename
-                    for ffilename, fdata in data.items():
-                        if folder[-1] == "/":
-                            fn = folder + ffilename
-                        else:
-                            fn = folder + "/" + ffilename
-                        with zip.open(fn, "w") as io:
-                            io.write(fdata.encode("utf-8"))
-                else:
-                    with zip.open(filename, "w") as io:
-                        io.write(data.encode("utf-8"))
-
-            for zfile in zip.filelist:
-                zfile.create_system = 0
+            for filename, data in self._archive_entries():
+                zinfo = ZipInfo(filename)
+                zinfo.compress_type = ZIP_DEFLATED
+                zinfo.create_system = 0
+                zinfo.external_attr = _EXTERNAL_ATTR
+                zip.writestr(zinfo, data, compresslevel=self.compresslevel)
 
         return filepath
+
+    def _write_with_libdeflate(self, filepath: FilePath | BytesIO) -> FilePath | BytesIO:
+        if isinstance(filepath, (str, os.PathLike)):
+            with open(filepath, "wb") as io:
+                _write_deflated_zip(io, self._archive_entries(), self.compresslevel)
+            return filepath
+
+        start = filepath.tell()
+        try:
+            _write_deflated_zip(filepath, self._archive_entries(), self.compresslevel)
+        except LargeZipFile:
+            filepath.seek(start)
+            filepath.truncate()
+            raise
+        return filepath
+
+    def _archive_entries(self) -> Iterator[tuple[str, bytes]]:
+        """Yields the archive name and content of all files. The structures
+        are serialized one at a time, so only a single file is kept in memory."""
+        for name, content in self._files().items():
+            if isinstance(content, dict):
+                folder = name if name[-1] == "/" else name + "/"
+                for filename, data in content.items():
+                    yield folder + filename, _to_json(data, self.indent)
+            else:
+                yield name, _to_json(content, self.indent)
+
+
+def _is_seekable(filepath: FilePath | BinaryIO) -> bool:
+    """Whether `filepath` is a path or a stream that can be rewound, which is
+    needed to fall back to ZipFile when the archive turns out too large."""
+    return isinstance(filepath, (str, os.PathLike)) or filepath.seekable()
+
+
+# Fixed parts of the zip records, see the .ZIP File Format Specification
+_LOCAL_FILE_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_DIRECTORY_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<IHHHHIIH")
+_ZIP_VERSION = 20  # Deflate, without zip64
+_UTF8_FLAG = 0x800
+_EXTERNAL_ATTR = 0o600 << 16  # -rw-------, as ZipFile gives files written by name
+# 1980-01-01 00:00:00, the default date_time of a ZipInfo
+_DOS_TIME = 0
+_DOS_DATE = 1 << 5 | 1
+
+
+def _compress(data: bytes, compresslevel: int) -> tuple[int, bytes]:
+    return deflate.crc32(data), deflate.deflate_compress(data, compresslevel)
+
+
+def _compressed_entries(
+    entries: Iterable[tuple[str, bytes]], compresslevel: int
+) -> Iterator[tuple[str, bytes, int, bytes]]:
+    """Yields the filename, data, CRC32 and compressed data of `entries`.
+
+    libdeflate releases the GIL, so on multi core machines the entries are
+    compressed by a worker thread per core while the next ones are
+    serialized. At most one entry per worker, plus the last serialized
+    one, is held in memory at a time.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        for filename, data in entries:
+            yield filename, data, *_compress(data, compresslevel)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for filename, data in entries:
+            pending.append(
+                (filename, data, executor.submit(_compress, data, compresslevel))
+            )
+            if len(pending) > workers:
+                filename, data, future = pending.popleft()
+                yield filename, data, *future.result()
+        while pending:
+            filename, data, future = pending.popleft()
+            yield filename, data, *future.result()
+
+
+def _write_deflated_zip(
+    io: BinaryIO, entries: Iterable[tuple[str, bytes]], compresslevel: int
+) -> None:
+    """Writes `entries` as DEFLATE compressed zip archive to `io`,
+    compressed with libdeflate.
+
+    The records match what ZipFile writes for the .stix files, with
+    create_system 0 (MS-DOS) and the default ZipInfo modification time.
+
+    Raises:
+        LargeZipFile: When the archive would need zip64 extensions,
+            which are not supported here.
+    """
+    offset = 0
+    central_directory = []
+    for filename, data, crc, compressed in _compressed_entries(entries, compresslevel):
+        name = filename.encode("utf-8")
+        flags = 0 if name.isascii() else _UTF8_FLAG
+        if (
+            len(central_directory) + 1 >= ZIP_FILECOUNT_LIMIT
+            or max(len(data), offset + len(compressed)) >= ZIP64_LIMIT
+        ):
+            raise LargeZipFile("Archive would require zip64 extensions.")
+
+        header = _LOCAL_FILE_HEADER.pack(
+            0x04034B50,
+            _ZIP_VERSION,
+            flags,
+            ZIP_DEFLATED,
+            _DOS_TIME,
+            _DOS_DATE,
+            crc,
+            len(compressed),
+            len(data),
+            len(name),
+            0,
+        )
+        io.write(header)
+        io.write(name)
+        io.write(compressed)
+
+        central_directory.append(
+            _CENTRAL_DIRECTORY_HEADER.pack(
+                0x02014B50,
+                _ZIP_VERSION,  # create_system 0 in the high byte
+                _ZIP_VERSION,
+                flags,
+                ZIP_DEFLATED,
+                _DOS_TIME,
+                _DOS_DATE,
+                crc,
+                len(compressed),
+                len(data),
+                len(name),
+                0,
+                0,
+                0,
+                0,
+                _EXTERNAL_ATTR,
+                offset,
+            )
+            + name
+        )
+        offset += len(header) + len(name) + len(compressed)
+
+    central_directory_size = sum(map(len, central_directory))
+    if offset + central_directory_size >= ZIP64_LIMIT:
+        raise LargeZipFile("Archive would require zip64 extensions.")
+    io.write(b"".join(central_directory))
+    io.write(
+        _END_OF_CENTRAL_DIRECTORY.pack(
+            0x06054B50,
+            0,
+            0,
+            len(central_directory),
+            len(central_directory),
+            central_directory_size,
+            offset,
+            0,
+        )
+    )
@@ -1,7 +1,8 @@
 # FROM https://github.com/python/cpython/blob/6292be7adf247589bbf03524f8883cb4cb61f3e9/Lib/typing.py
-from typing import _GenericAlias
+from types import UnionType
+from typing import Union
 from typing import get_args as get_args
-from typing import get_type_hints
+from typing import get_origin, get_type_hints
 
 
 def unpack_if_union(tp):
@@ -12,11 +13,13 @@ def unpack_if_union(tp):
 
 
 def is_union(tp):
-    return isinstance(tp, _GenericAlias) and tp._name in (None, "Optional")
+    """Optional, Union and `X | Y` types."""
+    return get_origin(tp) in (Union, UnionType)
 
 
 def is_list(tp):
-    return isinstance(tp, _GenericAlias) and tp._name == "List"
+    """Both list[X] and List[X] types."""
+    return get_origin(tp) is list
 
 
 def get_filtered_type_hints(class_type: type) -> list[tuple[str, type]]:
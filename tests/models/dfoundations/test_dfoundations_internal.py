@@ -1,10 +1,12 @@
 from random import randint
 
 import pytest
+from pydantic import ValidationError
 
 from geolib.models.dfoundations.dfoundations_structures import DFoundationsTableWrapper
 from geolib.models.dfoundations.internal import (
     CPT,
+    LAYER_DTYPE,
     CPTList,
     CPTMeasureData,
     DFoundationsCalculationParametersBearingPilesEC7,
@@ -15,9 +17,21 @@ from geolib.models.dfoundations.internal import (
     DFoundationsNenPileResultsTable,
     DFoundationsStructure,
     DFoundationsVerificationResults,
+    ExcavationType,
     Layer,
+    PileShape,
+    PositionBearingPile,
+    PositionsBearingPiles,
     Profile,
     Profiles,
+    RectangularPileGeometry,
+    RoundPileGeometry,
+    RoundPileWithLostTipGeometry,
+    RoundTaperedPileGeometry,
+    SoilCollection,
+    TypesBearingPiles,
+    TypesTensionPiles,
+    WarningFlag,
 )
 
 
@@ -96,6 +110,10 @@ class TestInternalInputDFoundations:
         assert parsed_profile
         assert parsed_profile.name == "FUGBEN 1"
         assert len(parsed_profile.layers) == 1
+        layers = parsed_profile.layers_array
+        assert layers.dtype == LAYER_DTYPE
+        assert layers["material"].tolist() == [9]
+        assert layers["top_level"].tolist() == [0.5]
 
     @pytest.mark.integrationtest
     def test_given_single_profile_text_when_parse_profiles_then_structure_parsed(self):
@@ -178,6 +196,247 @@ class TestInternalInputDFoundations:
         soils = Soil.default_soils(model="Belgian")
         assert len(soils) == 0
 
+    @pytest.mark.unittest
+    def test_given_flat_pile_type_fields_when_validate_then_geometry_by_shape(self):
+        # 1. Run test.
+        pile_type = TypesBearingPiles(
+            shape=PileShape.ROUND_PILE_WITH_LOST_TIP, base_diameter=0.5, pile_diameter=0.4
+        )
+
+        # 2. Verify final expectations.
+        assert isinstance(pile_type.geometry, RoundPileWithLostTipGeometry)
+        assert pile_type.shape == PileShape.ROUND_PILE_WITH_LOST_TIP
+        assert pile_type.base_diameter == 0.5
+        assert pile_type.diameter is None
+        assert isinstance(TypesTensionPiles().geometry, RectangularPileGeometry)
+        round_pile = TypesBearingPiles(shape=PileShape.ROUND_PILE, base_width=0.5)
+        assert round_pile.geometry == RoundPileGeometry()
+        assert round_pile.base_width == 0.5
+        round_pile.shape = PileShape.RECTANGULAR_PILE
+        assert round_pile.geometry == RectangularPileGeometry(base_width=0.5)
+
+    @pytest.mark.unittest
+    def test_given_pile_type_when_set_flat_fields_then_geometry_updated(self):
+        # 1. Define test data.
+        pile_type = TypesTensionPiles(shape=PileShape.ROUND_PILE, diameter=0.3)
+
+        # 2. Run test.
+        pile_type.diameter = 0.4
+        pile_type.base_width = 0.5
+        pile_type.shape = PileShape.ROUND_TAPERED_PILE
+
+        # 3. Verify final expectations.
+        assert pile_type.geometry == RoundTaperedPileGeometry(diameter=0.4)
+        assert pile_type.base_width == 0.5
+        pile_type.shape = PileShape.RECTANGULAR_PILE
+        assert pile_type.geometry == RectangularPileGeometry(base_width=0.5)
+        assert pile_type.diameter == 0.4
+        with pytest.raises(ValidationError):
+            pile_type.base_width = 200
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("dimensions_first", [True, False])
+    def test_given_pile_type_when_set_shape_and_dimension_then_geometry_has_dimension(
+        self, dimensions_first: bool
+    ):
+        # 1. Define test data.
+        pile_type = TypesBearingPiles()
+
+        # 2. Run test.
+        if dimensions_first:
+            pile_type.diameter = 0.4
+            pile_type.shape = PileShape.ROUND_PILE
+        else:
+            pile_type.shape = PileShape.ROUND_PILE
+            pile_type.diameter = 0.4
+
+        # 3. Verify final expectations.
+        assert pile_type.geometry == RoundPileGeometry(diameter=0.4)
+        assert pile_type.diameter == 0.4
+
+    @pytest.mark.unittest
+    def test_given_flat_pile_type_fields_when_unchecked_then_geometry_by_shape(
+        self, monkeypatch
+    ):
+        # 1. Define test data.
+        monkeypatch.setattr(
+            "geolib.models.dfoundations.internal.ENABLE_VALIDATION", False
+        )
+        fields = dict(shape=PileShape.ROUND_PILE, diameter=0.4, base_width=0.5)
+
+        # 2. Run test.
+        unchecked = TypesTensionPiles.unchecked(**fields)
+        trusted = TypesBearingPiles.from_trusted(**fields)
+
+        # 3. Verify final expectations.
+        for pile_type in (unchecked, trusted):
+            assert pile_type.geometry == RoundPileGeometry(diameter=0.4)
+            assert pile_type.base_width == 0.5
+
+    @pytest.mark.unittest
+    def test_given_position_rows_and_columns_when_bulk_add_then_positions_added(self):
+        # 1. Define test data.
+        position = dict(
+            x_coordinate=1.0,
+            y_coordinate=2.0,
+            pile_head_level=0.0,
+            surcharge=0.0,
+            limit_state_str=1.0,
+            limit_state_service=1.0,
+        )
+        positions = PositionsBearingPiles()
+
+        # 2. Run test.
+        positions.bulk_add([dict(position, index=1, pile_name="'Pos(1)'")])
+        positions.bulk_add_columns(
+            index=[2, 3],
+            pile_name=["'Pos(2)'", "'Pos(3)'"],
+            **{name: [value, value] for name, value in position.items()},
+        )
+
+        # 3. Verify final expectations.
+        assert [p.index for p in positions.positions] == [1, 2, 3]
+        assert all(isinstance(p, PositionBearingPile) for p in positions.positions)
+        with pytest.raises(ValidationError):
+            positions.bulk_add([dict(position, index=4, pile_name="")])
+        with pytest.raises(ValueError):
+            positions.bulk_add_columns(
+                index=[4, 5],
+                pile_name=["'Pos(4)'", "'Pos(5)'"],
+                **{name: [value] for name, value in position.items()},
+            )
+        assert len(positions.positions) == 3
+
+    @pytest.mark.unittest
+    def test_given_duplicate_pile_names_when_bulk_add_then_warns_and_not_added(self):
+        # 1. Define test data.
+        position = dict(
+            x_coordinate=1.0,
+            y_coordinate=2.0,
+            pile_head_level=0.0,
+            surcharge=0.0,
+            limit_state_str=1.0,
+            limit_state_service=1.0,
+        )
+        positions = PositionsBearingPiles()
+        positions.bulk_add([dict(position, index=1, pile_name="'Pos(1)'")])
+
+        # 2. Run test.
+        with pytest.warns(UserWarning, match="already exists"):
+            positions.bulk_add(
+                [
+                    dict(position, index=2, pile_name="'Pos(1)'"),
+                    dict(position, index=3, pile_name="'Pos(3)'"),
+                ]
+            )
+        with pytest.warns(UserWarning, match="already exists"):
+            positions.bulk_add_columns(
+                index=[4, 5],
+                pile_name=["'Pos(4)'", "'Pos(4)'"],
+                **{name: [value, value] for name, value in position.items()},
+            )
+
+        # 3. Verify final expectations.
+        assert [p.index for p in positions.positions] == [1, 3, 4]
+
+    @pytest.mark.unittest
+    def test_given_soil_collection_when_lookup_by_name_then_index_is_kept_in_sync(self):
+        from geolib.models.dfoundations.internal_soil import Soil
+
+        # 1. Define test data.
+        soils = SoilCollection(soil=Soil.default_soils(model="BEARING_PILES"))
+        new_soil = soils.soil[0].model_copy(update={"name": "New soil"})
+
+        # 2. Run test and verify expectations.
+        assert soils.find_soil_id("BClay, clean, moderate") == 0
+        soils.add_soil_if_unique(new_soil)
+        assert soils.find_soil_id("New soil") == 56
+        assert soils["New soil"] is new_soil
+        with pytest.raises(NameError):
+            soils.add_soil_if_unique(new_soil)
+
+        # Direct changes to the list invalidate the index.
+        soils.soil.insert(0, soils.soil.pop())
+        assert soils.find_soil_id("New soil") == 0
+
+        # Replaced and renamed items, which leave the length unchanged.
+        replacement = soils.soil[1].model_copy(update={"name": "Replaced soil"})
+        soils.soil[1] = replacement
+        assert soils["Replaced soil"] is replacement
+        soils.soil[2].name = "Renamed soil"
+        assert soils.find_soil_id("Renamed soil") == 2
+        with pytest.raises(NameError):
+            soils.add_soil_if_unique(
+                soils.soil[3].model_copy(update={"name": "Renamed soil"})
+            )
+        soils.soil = []
+        with pytest.raises(KeyError):
+            soils.find_soil_id("New soil")
+
+    @pytest.mark.unittest
+    def test_given_soil_collection_when_adding_many_soils_then_index_not_rebuilt(
+        self, monkeypatch
+    ):
+        from geolib.models.dfoundations.internal_soil import Soil
+
+        # 1. Define test data.
+        soil = Soil.default_soils(model="BEARING_PILES")[0]
+        new_soils = [soil.model_copy(update={"name": f"Soil {i}"}) for i in range(5000)]
+        soils = SoilCollection(soil=[soil])
+        rebuilds = []
+        rebuild_index = SoilCollection._rebuild_index
+        monkeypatch.setattr(
+            SoilCollection,
+            "_rebuild_index",
+            lambda self, *args: rebuilds.append(1) or rebuild_index(self, *args),
+        )
+
+        # 2. Run test.
+        for new_soil in new_soils:
+            soils.add_soil_if_unique(new_soil)
+
+        # 3. Verify final expectations.
+        assert len(rebuilds) == 1
+        assert soils.find_soil_id("Soil 4999") == 5000
+
+    @pytest.mark.unittest
+    def test_given_profiles_when_adding_many_profiles_then_index_not_rebuilt(
+        self, monkeypatch
+    ):
+        # 1. Define test data.
+        profile = Profile(
+            name="Profile",
+            matching_cpt=0,
+            x_coordinate=0.0,
+            y_coordinate=0.0,
+            phreatic_level=-1.0,
+            pile_tip_level=-10.0,
+            top_of_positive_skin_friction=0.0,
+            bottom_of_negative_skin_friction=-5.0,
+            excavation_level=0.0,
+        )
+        new_profiles = [
+            profile.model_copy(update={"name": f"Profile {i}"}) for i in range(5000)
+        ]
+        profiles = Profiles()
+        rebuilds = []
+        rebuild_index = Profiles._rebuild_index
+        monkeypatch.setattr(
+            Profiles,
+            "_rebuild_index",
+            lambda self, *args: rebuilds.append(1) or rebuild_index(self, *args),
+        )
+
+        # 2. Run test.
+        for new_profile in new_profiles:
+            profiles.add_profile_if_unique(new_profile)
+
+        # 3. Verify final expectations.
+        assert len(rebuilds) == 1
+        assert len(profiles.profiles) == 5000
+        with pytest.raises(NameError):
+            profiles.add_profile_if_unique(new_profiles[-1])
+
     @pytest.mark.integrationtest
     def test_given_single_cpt_text_when_parse_cpt_then_structure_parsed(self):
         # 1. Define test data.
@@ -250,7 +509,69 @@ class TestInternalInputDFoundations:
         # 3. Verify final expectations.
         assert parsed_cpt
         assert isinstance(parsed_cpt.measured_data, CPTMeasureData)
-        assert len(parsed_cpt.measured_data.data) == 2
+        assert len(parsed_cpt.measured_data.rows) == 2
+        assert list(parsed_cpt.measured_data.columns) == ["z", "qc"]
+        assert parsed_cpt.measured_data.columns["qc"].tolist() == [2.0, 2.4]
+
+    @pytest.mark.unittest
+    def test_given_cpt_json_when_from_json_bytes_then_structure_validated(self):
+        # 1. Define test data.
+        json_to_parse = (
+            b'{"cptname": "FUGBEN1", "excavation_type": 1, "timeorder_type": 1,'
+            b' "groundlevel": 0.5, "pre_excavation": 987654321.0,'
+            b' "interpretation_model": 0, "interpretation_model_stressdependent": 0,'
+            b' "depthrange": 0.1,'
+            b' "measured_data": {"data": [{"z": 0.5, "qc": 2}, {"z": 4.2, "qc": 2.4}]}}'
+        )
+
+        # 2. Run test.
+        parsed_cpt = CPT.from_json_bytes(json_to_parse)
+
+        # 3. Verify final expectations.
+        assert parsed_cpt.cptname == "FUGBEN1"
+        assert parsed_cpt.excavation_type == ExcavationType.BEFORE
+        assert isinstance(parsed_cpt.measured_data, CPTMeasureData)
+        assert parsed_cpt.measured_data.rows[0] == {"z": 0.5, "qc": 2.0}
+        assert CPT.from_json_bytes(parsed_cpt.model_dump_json()) == parsed_cpt
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param([{"z": 0.5, "qc": 2.0}, {"z": 4.2}], id="Ragged rows"),
+            pytest.param({"z": [0.5, 4.2], "qc": [2.0]}, id="Unequal columns"),
+        ],
+    )
+    def test_given_inconsistent_measured_data_when_validate_then_raises(self, data):
+        with pytest.raises(ValidationError):
+            CPTMeasureData(data=data)
+
+    @pytest.mark.unittest
+    def test_given_measured_data_when_get_data_then_deprecated_rows(self):
+        # 1. Define test data.
+        rows = [{"z": 0.5, "qc": 2.0}, {"z": 4.2, "qc": 2.4}]
+        measured_data = CPTMeasureData(data=rows)
+
+        # 2. Run test.
+        with pytest.warns(DeprecationWarning):
+            data = measured_data.data
+
+        # 3. Verify final expectations.
+        assert data == rows
+        with pytest.raises(AttributeError):
+            measured_data.data = rows
+
+    @pytest.mark.unittest
+    def test_given_cpt_when_json_schema_then_columns_are_number_arrays(self):
+        # 1. Run test.
+        schema = CPTMeasureData.model_json_schema()
+
+        # 2. Verify final expectations.
+        assert schema["properties"]["columns"]["additionalProperties"] == {
+            "type": "array",
+            "items": {"type": "number"},
+        }
+        assert "CPTMeasureData" in CPT.model_json_schema()["$defs"]
 
 
 class TestInternalOutputDFoundations:
@@ -456,6 +777,54 @@ class TestInternalOutputDFoundations:
         assert not parsed_warnings.f1_greater_than_1_found
         assert parsed_warnings.is_warning_sf_fund_width_given
         assert parsed_warnings.is_warning_nen_spacing_given == 12
+        assert parsed_warnings.warnings_mask == (
+            WarningFlag.IS_WARNING_F1_GIVEN
+            | WarningFlag.IS_WARNING_SF_FUND_WIDTH_GIVEN
+            | WarningFlag.IS_WARNING_NEN_BP_POSITIVE_SKIN_FRICTION_ZONE_GIVEN
+        )
+
+    @pytest.mark.integrationtest
+    def test_given_dumpfile_output_text_when_parse_then_sections_parsed_on_access(self):
+        # 1. Get test text.
+        group_text = self.get_group_text(self.dumpfile_output)
+
+        # 2. Parse.
+        parsed_output = DFoundationsDumpfileOutputStructure.parse_text(group_text)
+
+        # 3. Verify expectations.
+        assert isinstance(parsed_output._sections["calculation_warnings"], str)
+        assert isinstance(
+            parsed_output.calculation_warnings, DFoundationsCalculationWarnings
+        )
+        assert parsed_output._sections["calculation_warnings"] is (
+            parsed_output.calculation_warnings
+        )
+        assert parsed_output.verification_results_tp is None
+        assert "verification_results" in parsed_output.model_dump()
+
+    @pytest.mark.integrationtest
+    def test_given_parsed_dumpfile_output_when_dump_and_validate_then_equal(self):
+        # 1. Get test structure.
+        group_text = self.get_group_text(self.dumpfile_output)
+        parsed_output = DFoundationsDumpfileOutputStructure.parse_text(group_text)
+
+        # 2. Run test.
+        from_dict = DFoundationsDumpfileOutputStructure.model_validate(
+            parsed_output.model_dump()
+        )
+        from_kwargs = DFoundationsDumpfileOutputStructure(**parsed_output.model_dump())
+        from_json = DFoundationsDumpfileOutputStructure.model_validate_json(
+            parsed_output.model_dump_json()
+        )
+
+        # 3. Verify expectations.
+        for validated in (from_dict, from_kwargs, from_json):
+            assert isinstance(
+                validated.calculation_warnings, DFoundationsCalculationWarnings
+            )
+            assert validated == parsed_output
+        with pytest.raises(ValidationError):
+            from_dict.calculation_warnings = "not a section"
 
     @pytest.mark.integrationtest
     def test_given_nen_average_pile_factors_text_when_parse_then_returns_structure(self):
@@ -395,6 +395,39 @@ class TestDFoundationsModel:
         with pytest.raises(KeyError):
             df.add_profile(setup_profile)
 
+    @pytest.mark.integrationtest
+    def test_add_profiles_overrides_excavation_level(self, setup_profile):
+        df = DFoundationsModel()
+        second_profile = setup_profile.model_copy(
+            update={"name": "DELFT2", "excavation": Excavation(excavation_level=-0.2)},
+            deep=True,
+        )
+
+        df.add_profile(setup_profile)
+        df.add_profile(second_profile)
+
+        assert [p.excavation_level for p in df.profiles.profiles] == [-0.2, -0.2]
+        with pytest.raises(NameError):
+            df.add_profile(second_profile.model_copy(update={"layers": []}))
+
+    @pytest.mark.integrationtest
+    def test_add_profile_without_validation(self, setup_profile, monkeypatch):
+        monkeypatch.setattr(
+            "geolib.models.dfoundations.internal.ENABLE_VALIDATION", False
+        )
+        df = DFoundationsModel()
+        output_test_folder = Path(TestUtils.get_output_test_data_dir("dfoundations"))
+        output_test_file = output_test_folder / "test_add_profile_without_validation.foi"
+
+        df.add_profile(setup_profile)
+
+        cpt = df.cpts.cpt_collection[0]
+        assert cpt.measured_data.rows[0] == {"z": 0.0, "qc": 0.1}
+        assert df.profiles.profiles[0].excavation_level == -0.1
+        assert "cptname" in cpt.model_fields_set
+        df.serialize(output_test_file)
+        assert output_test_file.is_file()
+
     @pytest.mark.acceptance
     @only_teamcity
     def test_run_model_from_scratch(self, setup_profile):
@@ -508,7 +541,8 @@ class TestDFoundationsModel:
         pile = BearingRectangularPile(**parent_pile, **geometry_pile)
 
         df.add_pile_if_unique(pile, location)
-        df.add_pile_if_unique(pile, location)
+        with pytest.warns(UserWarning, match="already exists, pile is not added"):
+            df.add_pile_if_unique(pile, location)
 
         positions = df.datastructure.input_data.positions___bearing_piles.positions
         df.serialize(output_test_file)
@@ -633,7 +667,8 @@ class TestDFoundationsModel:
         pile = TensionRectangularPile(**parent_pile, **geometry_pile)
 
         df.add_pile_if_unique(pile, location)
-        df.add_pile_if_unique(pile, location)
+        with pytest.warns(UserWarning, match="already exists, pile is not added"):
+            df.add_pile_if_unique(pile, location)
 
         positions = df.datastructure.input_data.positions___tension_piles_cur.positions
         df.serialize(output_test_file)
@@ -865,6 +900,19 @@ class TestDFoundationsModel:
         assert co.factor_xi3 == 0.1
         assert co.is_xi3_overruled == Bool.TRUE
 
+    @pytest.mark.unittest
+    def test_calculation_options_when_value_assigned_other_toggles_unchanged(self):
+        # Setup
+        co = InternalCalculationOptions(factor_xi3=0.1, is_xi4_overruled=Bool.FALSE)
+
+        # Test
+        co.factor_gamma_b = 3
+
+        # Verify expectations
+        assert co.is_xi3_overruled == Bool.TRUE
+        assert co.is_xi4_overruled == Bool.FALSE
+        assert co.is_gamma_b_overruled == Bool.FALSE
+
 
 @pytest.fixture
 def create_bearing_pile():
@@ -1,9 +1,12 @@
+import json
 import os
+from io import BytesIO, UnsupportedOperation
 from pathlib import Path
+from zipfile import ZipFile
 
 import pytest
 
-from geolib.models.dstability import DStabilityModel
+from geolib.models.dstability import DStabilityModel, serializer
 from geolib.models.dstability.dstability_parserprovider import (
     DStabilityParser,
     DStabilityZipParser,
@@ -104,6 +107,123 @@ class TestDStabilityInputParser:
         ds = DStabilityInputZipSerializer(ds=input_structure)
         ds.write(test_output_filepath)
 
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_stix_with_libdeflate_equals_zipfile(self, monkeypatch):
+        # 1. Set up test model
+        pytest.importorskip("deflate")
+        input_structure = DStabilityModel().datastructure
+        ds = DStabilityInputZipSerializer(ds=input_structure)
+
+        # 2. Run test.
+        libdeflate_zip = ds.write(BytesIO())
+        monkeypatch.setattr(serializer, "deflate", None)
+        stdlib_zip = ds.write(BytesIO())
+
+        # 3. Verify final expectations.
+        with ZipFile(libdeflate_zip) as archive, ZipFile(stdlib_zip) as expected:
+            assert archive.testzip() is None
+            assert archive.namelist() == expected.namelist()
+            for info, expected_info in zip(archive.infolist(), expected.infolist()):
+                assert info.create_system == expected_info.create_system == 0
+                assert info.external_attr == expected_info.external_attr
+                assert info.date_time == expected_info.date_time
+                assert archive.read(info) == expected.read(expected_info)
+
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_stix_compressed_in_thread_is_identical(
+        self, monkeypatch
+    ):
+        # 1. Set up test model
+        pytest.importorskip("deflate")
+        input_structure = DStabilityModel().datastructure
+        ds = DStabilityInputZipSerializer(ds=input_structure)
+
+        # 2. Run test.
+        monkeypatch.setattr(os, "cpu_count", lambda: 1)
+        sequential_zip = ds.write(BytesIO())
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        threaded_zip = ds.write(BytesIO())
+
+        # 3. Verify final expectations.
+        assert threaded_zip.getvalue() == sequential_zip.getvalue()
+
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_stix_writes_compact_json(self):
+        # 1. Set up test model
+        input_structure = DStabilityModel().datastructure
+        indented = DStabilityInputSerializer(ds=input_structure).serialize()
+
+        # 2. Run test.
+        output = DStabilityInputZipSerializer(ds=input_structure).write(BytesIO())
+
+        # 3. Verify final expectations.
+        with ZipFile(output) as archive:
+            data = archive.read("projectinfo.json")
+        assert b"\n" not in data
+        assert json.loads(data) == json.loads(indented["projectinfo.json"])
+
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_stix_with_higher_compresslevel_is_smaller(
+        self, monkeypatch
+    ):
+        # 1. Set up test model
+        input_structure = DStabilityModel().datastructure
+        ds = DStabilityInputZipSerializer(ds=input_structure)
+        monkeypatch.setattr(serializer, "deflate", None)
+
+        # 2. Run test.
+        fast_zip = ds.write(BytesIO())
+        monkeypatch.setattr(DStabilityInputZipSerializer, "compresslevel", 9)
+        small_zip = ds.write(BytesIO())
+
+        # 3. Verify final expectations.
+        assert len(small_zip.getvalue()) < len(fast_zip.getvalue())
+
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_large_stix_falls_back_to_zipfile(self, monkeypatch):
+        # 1. Set up test model
+        pytest.importorskip("deflate")
+        input_structure = DStabilityModel().datastructure
+        ds = DStabilityInputZipSerializer(ds=input_structure)
+        monkeypatch.setattr(serializer, "ZIP64_LIMIT", 10000)
+
+        # 2. Run test.
+        output = BytesIO(b"prefix")
+        output.seek(len(b"prefix"))
+        ds.write(output)
+        monkeypatch.setattr(serializer, "deflate", None)
+        expected_output = ds.write(BytesIO())
+
+        # 3. Verify final expectations.
+        assert output.getvalue().startswith(b"prefixPK")
+        with ZipFile(output) as archive, ZipFile(expected_output) as expected:
+            assert archive.testzip() is None
+            assert archive.namelist() == expected.namelist()
+
+    @pytest.mark.integrationtest
+    def test_dstability_serialize_stix_to_unseekable_stream_uses_zipfile(self):
+        # 1. Set up test model
+        class UnseekableBytesIO(BytesIO):
+            def seekable(self):
+                return False
+
+            def seek(self, *args):
+                raise UnsupportedOperation("seek")
+
+            def tell(self):
+                raise UnsupportedOperation("tell")
+
+        input_structure = DStabilityModel().datastructure
+        ds = DStabilityInputZipSerializer(ds=input_structure)
+
+        # 2. Run test.
+        output = ds.write(UnseekableBytesIO())
+
+        # 3. Verify final expectations.
+        with ZipFile(BytesIO(output.getvalue())) as archive:
+            assert archive.testzip() is None
+            assert "projectinfo.json" in archive.namelist()
+
     @pytest.mark.integrationtest
     def test_dstability_serialize_folders(self):
         # 1. Set up test model
@@ -744,6 +744,23 @@ class TestDSeriesInlineProperties:
         # 3. Verify final expectations.
         assert key, value == expected_result
 
+    @pytest.mark.unittest
+    def test_given_derived_structure_when_get_required_properties_names_then_returns_own_order(
+        self,
+    ):
+        # 1. Define test data.
+        class extended(self.combined):
+            property_4: str
+
+        # 2. Run test.
+        base_names = self.combined.get_required_properties_names()
+        extended_names = extended.get_required_properties_names()
+
+        # 3. Verify final expectations.
+        assert base_names == ("property_1", "property_2", "property_3")
+        assert extended_names == base_names + ("property_4",)
+        assert self.combined.get_required_properties_names() is base_names
+
 
 class TestDSeriesInlineReversedProperties:
     @pytest.mark.integrationtest